@@ -18,6 +18,7 @@ model (ComprehensiveEntity) from example5.py, which includes:
 This represents the most comprehensive validation scenario possible with Satya.
 """
 
+import argparse
 import time
 import json
 import sys
@@ -52,15 +53,6 @@ except ImportError:
     print("⚠️  memory_profiler not available. Install with: pip install memory-profiler")
     MEMORY_PROFILER_AVAILABLE = False
 
-# Plotting
-try:
-    import matplotlib.pyplot as plt
-    import numpy as np
-    PLOTTING_AVAILABLE = True
-except ImportError:
-    print("⚠️  matplotlib not available. Install with: pip install matplotlib")
-    PLOTTING_AVAILABLE = False
-
 
 class MsgspecComprehensiveEntity(Struct):
     """Simplified msgspec version of ComprehensiveEntity for comparison"""
@@ -456,8 +448,11 @@ def measure_memory_usage(func, *args, **kwargs):
 
 def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks/results"):
     """Create performance visualization charts"""
-    if not PLOTTING_AVAILABLE:
-        print("⚠️  Skipping visualizations (matplotlib not available)")
+    # Imported lazily: matplotlib adds several hundred ms of startup time
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("⚠️  Skipping visualizations (matplotlib not available). Install with: pip install matplotlib")
         return
     
     os.makedirs(output_dir, exist_ok=True)
@@ -468,7 +463,8 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
     avg_time_ms = [r['avg_time_per_item'] for r in results['benchmarks']]
     
     # Create comprehensive performance comparison
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 12))
+    # (constrained layout: one layout pass at save time, no tight_layout)
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(20, 12), layout='constrained')
     
     # 1. Items per second comparison
     colors = ['#2E86AB' if 'Satya' in lib else '#A23B72' for lib in libraries]
@@ -480,10 +476,8 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
     ax1.grid(axis='y', alpha=0.3)
     
     # Add value labels on bars
-    for bar, value in zip(bars1, items_per_sec):
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{value:,.0f}', ha='center', va='bottom', fontweight='bold', fontsize=10)
+    ax1.bar_label(bars1, labels=[f'{value:,.0f}' for value in items_per_sec],
+                  padding=3, fontweight='bold', fontsize=10)
     
     # 2. Average time per item
     bars2 = ax2.bar(range(len(libraries)), avg_time_ms, color=colors)
@@ -494,10 +488,8 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
     ax2.grid(axis='y', alpha=0.3)
     
     # Add value labels on bars
-    for bar, value in zip(bars2, avg_time_ms):
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                f'{value:.3f}ms', ha='center', va='bottom', fontweight='bold', fontsize=10)
+    ax2.bar_label(bars2, labels=[f'{value:.3f}ms' for value in avg_time_ms],
+                  padding=3, fontweight='bold', fontsize=10)
     
     # 3. Batch size performance analysis
     batch_results = [r for r in results['benchmarks'] if 'batch=' in r['library']]
@@ -545,12 +537,9 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
         ax4.grid(axis='y', alpha=0.3)
         
         # Add value labels
-        for bar, value in zip(bars4, speedup_data.values()):
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                    f'{value:.1f}x', ha='center', va='bottom', fontweight='bold', fontsize=12)
+        ax4.bar_label(bars4, labels=[f'{value:.1f}x' for value in speedup_data.values()],
+                      padding=3, fontweight='bold', fontsize=12)
     
-    plt.tight_layout()
     plt.savefig(f"{output_dir}/example5_comprehensive_performance.png", dpi=300, bbox_inches='tight')
     plt.close()
     
@@ -560,7 +549,7 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
         valid_memory = {k: v for k, v in memory_data.items() if v and v.get('max_memory_mb')}
         
         if valid_memory:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), layout='constrained')
             
             # Peak memory usage
             libraries_mem = list(valid_memory.keys())
@@ -577,10 +566,8 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
             ax1.grid(axis='y', alpha=0.3)
             
             # Add value labels
-            for bar, value in zip(bars1, max_memory):
-                height = bar.get_height()
-                ax1.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                        f'{value:.1f}MB', ha='center', va='bottom', fontweight='bold')
+            ax1.bar_label(bars1, labels=[f'{value:.1f}MB' for value in max_memory],
+                          padding=3, fontweight='bold')
             
             # Average memory usage
             bars2 = ax2.bar(range(len(libraries_mem)), avg_memory, color=colors_mem)
@@ -591,12 +578,9 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
             ax2.grid(axis='y', alpha=0.3)
             
             # Add value labels
-            for bar, value in zip(bars2, avg_memory):
-                height = bar.get_height()
-                ax2.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                        f'{value:.1f}MB', ha='center', va='bottom', fontweight='bold')
+            ax2.bar_label(bars2, labels=[f'{value:.1f}MB' for value in avg_memory],
+                          padding=3, fontweight='bold')
             
-            plt.tight_layout()
             plt.savefig(f"{output_dir}/example5_memory_comparison.png", dpi=300, bbox_inches='tight')
             plt.close()
     
@@ -607,6 +591,13 @@ def create_visualizations(results: Dict[str, Any], output_dir: str = "benchmarks
 
 def main():
     """Run comprehensive benchmark comparing Satya vs msgspec"""
+    parser = argparse.ArgumentParser(description="Comprehensive benchmark: Satya vs msgspec (example5 model)")
+    parser.add_argument("--count", type=int, default=100000, help="Number of entities to generate")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1000, 5000, 10000, 20000],
+                        help="Satya batch sizes to test")
+    parser.add_argument("--no-graph", action="store_true", help="Skip matplotlib charts")
+    args = parser.parse_args()
+
     print("🚀 Comprehensive Validation Benchmark: Satya vs msgspec")
     print("=" * 60)
     print("📋 Using Ultra-Complex ComprehensiveEntity Model")
@@ -618,8 +609,8 @@ def main():
     print("=" * 60)
     
     # Configuration
-    dataset_size = 100000  # Large dataset for comprehensive testing
-    batch_sizes = [1000, 5000, 10000, 20000]  # Test different batch sizes
+    dataset_size = args.count
+    batch_sizes = args.batch_sizes
     
     print(f"📊 Dataset: {dataset_size:,} comprehensive entities")
     print(f"📦 Testing batch sizes: {batch_sizes}")
@@ -784,7 +775,8 @@ def main():
         json.dump(results, f, indent=2, default=str)
     
     # Create visualizations
-    create_visualizations(results, output_dir)
+    if not args.no_graph:
+        create_visualizations(results, output_dir)
     
     print(f"\n💾 Results saved to {output_dir}/example5_comprehensive_benchmark_results.json")
     print("\n🎉 Comprehensive benchmark completed!")
@@ -236,8 +236,11 @@ def satya_get_item(item_id: int, item_size: str = Query("small")):
     return SatyaItem(**data)
 
 # ======================= Benchmark Logic =======================
-@dataclass
+@dataclass(frozen=True)
 class BenchmarkResult:
+    # Spelled out because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("framework", "scenario", "operation", "times")
+
     framework: str
     scenario: str
     operation: str
@@ -0,0 +1,582 @@
+#!/usr/bin/env python3
+"""
+JSON Serialization & Parsing Benchmark: Satya vs json vs orjson vs msgspec
+==========================================================================
+
+Serialization rows validate-and-encode each record (Satya) or just encode it
+(json/orjson/msgspec). Parsing rows decode each record from JSON and, for
+Satya, validate it against the model.
+
+Usage:
+    python benchmarks/json_benchmark.py --count 1000 --iterations 50
+    python benchmarks/json_benchmark.py --no-graph
+    python benchmarks/json_benchmark.py --iterations 0   # timeit autorange
+    python benchmarks/json_benchmark.py --parallel       # + thread/process pool and scaling rows
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import time
+import timeit
+import uuid
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from satya import Model, Field
+from satya.validator import StreamValidator
+from satya.json_loader import load_json
+from satya._satya import dump_json, simd_json_enabled
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    print("⚠️  orjson not available. Install with: pip install orjson")
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    print("⚠️  msgspec not available. Install with: pip install msgspec")
+    MSGSPEC_AVAILABLE = False
+
+# Extra parsing baselines; their rows are simply left out when not installed
+try:
+    import rapidjson
+    HAS_RAPIDJSON = True
+except ImportError:
+    HAS_RAPIDJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
+
+
+class Address(Model):
+    street: str = Field(min_length=5, max_length=100)
+    city: str = Field(pattern=r"^[A-Za-z\s]+$", min_length=2, max_length=50)
+    zip_code: str = Field(pattern=r"^\d{5}(-\d{4})?$")
+
+
+class User(Model):
+    id: str = Field(pattern=r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+    name: str = Field(pattern=r"^[A-Za-z\s]+$", min_length=2, max_length=50)
+    email: str = Field(email=True)
+    age: int = Field(ge=0, le=120)
+    score: float = Field(ge=0.0, le=100.0)
+    is_active: bool
+    address: Address
+    tags: List[str] = Field(max_items=10)
+
+
+class FloatRecord(Model):
+    """Single-float schema: isolates text -> f64 cost from struct walking."""
+    score: float
+
+
+CITIES = ["New York", "San Francisco", "Seattle", "Austin", "Boston"]
+TAGS = ["admin", "staff", "beta", "premium", "trial"]
+
+
+def generate_test_data(count: int) -> List[Dict[str, Any]]:
+    """Generate User records matching the model above.
+
+    The nested ``address`` dict and ``tags`` list are built once and shared by
+    every record: they are read-only here (validation copies before
+    replacing nested models), and sharing them avoids ``2 * count`` extra
+    allocations while keeping the serialized output identical in shape.
+    Per-record allocator behaviour of the encoders is unaffected, since each
+    call still walks and encodes the nested values.
+
+    Records are copied from one template dict, so key order and the dict
+    layout are fixed once and each record only overwrites its varying
+    values.
+    """
+    template = {
+        "id": "",
+        "name": "",
+        "email": "",
+        "age": 0,
+        "score": 0.0,
+        "is_active": False,
+        "address": {
+            "street": "1600 Main Street",
+            "city": random.choice(CITIES),
+            "zip_code": f"{random.randint(10000, 99999)}",
+        },
+        "tags": random.sample(TAGS, 3),
+    }
+    email = "user{}@example.com".format
+    randint, uniform, choice, uuid4 = random.randint, random.uniform, random.choice, uuid.uuid4
+
+    out: List[Dict[str, Any]] = []
+    append = out.append
+    for i in range(count):
+        d = template.copy()
+        d["id"] = str(uuid4())
+        d["name"] = "User " + chr(65 + i % 26)
+        d["email"] = email(i)
+        d["age"] = randint(18, 80)
+        d["score"] = round(uniform(0, 100), 2)
+        d["is_active"] = choice((True, False))
+        append(d)
+    return out
+
+
+def to_columns(records: List[Dict[str, Any]]) -> Dict[str, Sequence[Any]]:
+    """Transpose records into one sequence per field (struct-of-arrays).
+
+    Numeric columns are unboxed ``array.array``s; the rest stay lists.
+    """
+    columns: Dict[str, Sequence[Any]] = {key: [r[key] for r in records] for key in records[0]}
+    columns["age"] = array("q", columns["age"])
+    columns["score"] = array("d", columns["score"])
+    return columns
+
+
+def _dumps_rows(dumps: Callable[[Any], Any], columns: Dict[str, Sequence[Any]]) -> None:
+    # Rebuilds each record dict from the columns right before encoding it
+    keys = tuple(columns)
+    _consume(dumps(dict(zip(keys, row))) for row in zip(*columns.values()))
+
+
+def generate_floats_json(count: int) -> List[bytes]:
+    """Generate ``{"score": <float>}`` documents for the floats-only variant."""
+    return [json.dumps({"score": round(random.uniform(0, 100), 2)}).encode() for _ in range(count)]
+
+
+def encode_records(records: List[Dict[str, Any]], validator: StreamValidator) -> List[bytes]:
+    """Encode the parsing inputs with one Rust call instead of one dumps per record.
+
+    to_json_many returns a single buffer plus offsets; slicing it yields the
+    per-record documents without a str round-trip.
+    """
+    blob, offsets = validator.to_json_many(records)
+    return [blob[start:end] for start, end in zip(offsets, offsets[1:])]
+
+
+WARMUP = 10
+
+
+def tune_process(pin: bool = True) -> None:
+    """Pin to one CPU and warn about frequency-scaling noise (Linux only).
+
+    Pass pin=False when running worker pools: threads and child processes
+    inherit the affinity mask and would all share CPU 0.
+    """
+    if pin and hasattr(os, "sched_setaffinity"):
+        try:
+            os.sched_setaffinity(0, {0})
+            print("📌 Pinned benchmark process to CPU 0")
+        except OSError as e:
+            print(f"⚠️  Could not pin to CPU 0: {e}")
+
+    def read(path: str):
+        try:
+            with open(path) as f:
+                return f.read().strip()
+        except OSError:
+            return None
+
+    warnings = []
+    no_turbo = read("/sys/devices/system/cpu/intel_pstate/no_turbo")
+    if no_turbo is not None and no_turbo != "1":
+        warnings.append("turbo boost is enabled (intel_pstate/no_turbo != 1)")
+    paranoid = read("/proc/sys/kernel/perf_event_paranoid")
+    if paranoid is not None and int(paranoid) > 1:
+        warnings.append(f"perf counters restricted (perf_event_paranoid = {paranoid})")
+    if warnings:
+        print("⚠️  System is not tuned for benchmarking; expect run-to-run noise:")
+        for w in warnings:
+            print(f"   • {w}")
+
+
+def _ops_per_sec(count: int, elapsed: float) -> float:
+    return count / elapsed if elapsed > 0 else float("inf")
+
+
+# Drains an iterator in C without keeping any results
+_consume = deque(maxlen=0).extend
+
+
+def _bench(func: Callable[[Any], Any], items: List[Any]) -> None:
+    # map() drives the loop in C, so no per-record bytecode dispatch is
+    # charged to any row: every row measures only func itself
+    _consume(map(func, items))
+
+
+@contextmanager
+def _gc_paused():
+    """Collect once, then keep the cyclic GC off for the timed section.
+
+    Each row allocates millions of short-lived dicts/bytes; a generational
+    collection landing mid-row adds a pause unrelated to the code being
+    measured. Collecting first also stops garbage left by the previous row
+    from being charged to this one.
+    """
+    was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _time(stmt: Callable[[], Any], iterations: int):
+    """Time `iterations` calls of stmt; return (calls, seconds).
+
+    With iterations <= 0, timeit picks the call count itself (autorange:
+    enough calls to take at least 0.2 s).
+    """
+    with _gc_paused():
+        if iterations <= 0:
+            return timeit.Timer(stmt).autorange()
+        # Integer nanoseconds: no float rounding in the clock reads
+        elapsed_ns = timeit.Timer(stmt, timer=time.perf_counter_ns).timeit(number=iterations)
+        return iterations, elapsed_ns / 1e9
+
+
+def _run(func: Callable[[Any], Any], items: List[Any], iterations: int) -> float:
+    """Call func on every item `iterations` times; return records/sec.
+
+    A short untimed warm-up pass primes caches and branch predictors first.
+    """
+    _bench(func, items[:WARMUP])
+    calls, elapsed = _time(lambda: _bench(func, items), iterations)
+    return _ops_per_sec(len(items) * calls, elapsed)
+
+
+def _run_bulk(func: Callable[[], Any], records: int, iterations: int) -> float:
+    """Like _run, for calls that process all `records` at once."""
+    func()
+    calls, elapsed = _time(func, iterations)
+    return _ops_per_sec(records * calls, elapsed)
+
+
+def pack_json(json_bytes: List[bytes]):
+    """Concatenate documents into one contiguous buffer plus an offset table."""
+    offsets = [0]
+    for b in json_bytes:
+        offsets.append(offsets[-1] + len(b))
+    return b"".join(json_bytes), offsets
+
+
+Case = Tuple[str, Callable[[int], float]]
+
+
+def _per_record(name: str, func: Callable[[Any], Any], items: List[Any]) -> Case:
+    """A row that calls func once per item; func should be pre-bound."""
+    return name, partial(_run, func, items)
+
+
+def _bulk(name: str, func: Callable[[], Any], records: int) -> Case:
+    """A row where one func() call processes all `records`."""
+    return name, partial(_run_bulk, func, records)
+
+
+def run_cases(cases: List[Case], iterations: int) -> Dict[str, float]:
+    """Run every row through the same timing path; return records/sec by name."""
+    return {name: run(iterations) for name, run in cases}
+
+
+def benchmark_json_methods(test_data: List[Dict[str, Any]], validator: StreamValidator,
+                           iterations: int) -> Dict[str, float]:
+    """Benchmark serialization throughput (records/sec) for each method."""
+    print(f"🔍 Serializing {len(test_data):,} records x {iterations} iterations...")
+    # Reused output buffers: no per-call bytes allocation
+    out = bytearray(4096)
+    # Serialization only, from already-built instances
+    users = [User(**data) for data in test_data]
+    columns = to_columns(test_data)
+
+    cases: List[Case] = [_per_record("json.dumps", json.dumps, test_data)]
+    if ORJSON_AVAILABLE:
+        dumps = orjson.dumps
+        cases += [
+            _per_record("orjson.dumps", dumps, test_data),
+            # Bulk baseline: the whole list as one JSON array, one call
+            _bulk("orjson.dumps (whole list)", partial(dumps, test_data), len(test_data)),
+            # Instance -> dict walk plus encode
+            _per_record("orjson.dumps(user.model_dump())", lambda user: dumps(user.model_dump()), users),
+            # Same records held as columns: the difference from orjson.dumps
+            # is the cost of materializing row dicts on the fly
+            _bulk("orjson.dumps (rows from columns)", partial(_dumps_rows, dumps, columns), len(test_data)),
+        ]
+    if MSGSPEC_AVAILABLE:
+        encoder = msgspec.json.Encoder()
+        encode_into = encoder.encode_into
+        cases += [
+            _per_record("msgspec.encode", encoder.encode, test_data),
+            _bulk("msgspec.encode (whole list)", partial(encoder.encode, test_data), len(test_data)),
+            _per_record("msgspec.encode_into", lambda data: encode_into(data, out), test_data),
+        ]
+    to_json_into = validator.to_json_into
+    cases += [
+        _per_record("Satya to_json", validator.to_json, test_data),
+        # Instance path vs. dict path: json_from_dict skips __init__ entirely
+        _per_record("Satya User(**d).model_dump_json", lambda data: User(**data).model_dump_json(), test_data),
+        _per_record("Satya User.json_from_dict", User.json_from_dict, test_data),
+        _per_record("Satya user.model_dump_json", User.model_dump_json, users),
+        _per_record("Satya user.json_bytes", User.json_bytes, users),
+        # One Rust call serializes the whole list
+        _bulk("Satya to_json_batch", partial(validator.to_json_batch, test_data), len(test_data)),
+        # Encoder only, whole list as one JSON array: the like-for-like row
+        # for "orjson.dumps (whole list)", as a batch API response would be
+        _bulk("Satya dump_json (whole list)", partial(dump_json, test_data), len(test_data)),
+        # One buffer + offsets: field-name prefixes encoded once per batch
+        _bulk("Satya to_json_many", partial(validator.to_json_many, test_data), len(test_data)),
+        _per_record("Satya to_json_into", lambda data: to_json_into(data, out), test_data),
+        # Whole list written back to back into one reused bytearray
+        _bulk("Satya to_json_all_into", partial(validator.to_json_all_into, test_data, out), len(test_data)),
+    ]
+    return run_cases(cases, iterations)
+
+
+def _to_json_chunk(chunk: List[Dict[str, Any]]) -> int:
+    # Module-level so ProcessPoolExecutor can pickle it; each worker process
+    # builds (and then reuses) its own cached validator
+    _bench(User.validator().to_json, chunk)
+    return len(chunk)
+
+
+def benchmark_parallel(test_data: List[Dict[str, Any]], validator: StreamValidator,
+                       iterations: int, workers: int) -> Dict[str, float]:
+    """Serialization throughput with the records sharded across `workers`.
+
+    orjson releases the GIL while encoding, so a thread pool can scale it.
+    Satya's validate step runs Python code under the GIL, so its to_json is
+    measured both on threads (for comparison) and on a process pool, where
+    the chunks are pickled to the workers as part of the timed work.
+    """
+    print(f"🔍 Serializing {len(test_data):,} records x {iterations} iterations on {workers} workers...")
+    chunks = [test_data[i::workers] for i in range(workers)]
+    count = len(test_data)
+    to_json = validator.to_json
+    cases: List[Case] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        if ORJSON_AVAILABLE:
+            dumps = orjson.dumps
+            cases.append(_bulk("orjson.dumps (threads)",
+                               lambda: list(pool.map(partial(_bench, dumps), chunks)), count))
+        cases.append(_bulk("Satya to_json (threads)",
+                           lambda: list(pool.map(partial(_bench, to_json), chunks)), count))
+        results = run_cases(cases, iterations)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results.update(run_cases(
+            [_bulk("Satya to_json (processes)", lambda: list(pool.map(_to_json_chunk, chunks)), count)],
+            iterations,
+        ))
+    return results
+
+
+def benchmark_thread_scaling(json_bytes: List[bytes], validator: StreamValidator, iterations: int,
+                             max_workers: int) -> Dict[str, float]:
+    """Streaming NDJSON validation throughput at 1, 2, 4, ... threads.
+
+    validate_json(..., mode="ndjson", streaming=True) validates each line
+    straight from the byte buffer with the GIL released, so unlike the
+    to_json rows above it can scale with the thread count.
+    """
+    count = len(json_bytes)
+    validate = partial(validator.validate_json, mode="ndjson", streaming=True)
+    results: Dict[str, float] = {}
+    workers = 1
+    while workers <= max_workers:
+        print(f"🔍 Validating {count:,} NDJSON records x {iterations} iterations on {workers} threads...")
+        shards = [b"\n".join(json_bytes[i::workers]) for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results.update(run_cases(
+                [_bulk(f"Satya validate_json ndjson ({workers} threads)",
+                       lambda: list(pool.map(validate, shards)), count)],
+                iterations,
+            ))
+        workers *= 2
+    return results
+
+
+def _str_and_bytes_rows(name: str, loads: Callable[[Any], Any], json_strings: List[str],
+                        json_bytes: List[bytes]) -> List[Case]:
+    """``<name> (str)`` and ``<name> (bytes)`` rows for one parser.
+
+    The two inputs take different paths in most parsers (bytes skips the
+    str -> UTF-8 step). An input type the parser rejects is reported and
+    its row left out.
+    """
+    cases: List[Case] = []
+    for kind, items in (("str", json_strings), ("bytes", json_bytes)):
+        try:
+            loads(items[0])
+        except (TypeError, ValueError) as e:
+            print(f"⚠️  Skipping {name} ({kind}): {e}")
+            continue
+        cases.append(_per_record(f"{name} ({kind})", loads, items))
+    return cases
+
+
+def benchmark_parsing(json_bytes: List[bytes], validator: StreamValidator, iterations: int,
+                      label: str = "User") -> Dict[str, float]:
+    """Benchmark parse (and, for Satya, validate) throughput in records/sec."""
+    print(f"🔍 Parsing {len(json_bytes):,} {label} records x {iterations} iterations...")
+    count = len(json_bytes)
+
+    # str input for json.loads and the (str) rows, decoded here outside the
+    # timed rows; every other row takes bytes
+    json_strings = [b.decode() for b in json_bytes]
+    # One contiguous buffer: sequential access instead of scattered objects
+    blob, offsets = pack_json(json_bytes)
+    ndjson = b"\n".join(json_bytes)
+
+    # Bulk baselines decode the same records as one JSON array document
+    array_doc = b"[" + b",".join(json_bytes) + b"]"
+
+    cases: List[Case] = [_per_record("json.loads", json.loads, json_strings)]
+    if ORJSON_AVAILABLE:
+        loads = orjson.loads
+        cases += [
+            _per_record("orjson.loads", loads, json_bytes),
+            _bulk("orjson.loads (whole array)", partial(loads, array_doc), count),
+        ]
+    if MSGSPEC_AVAILABLE:
+        decode = msgspec.json.Decoder().decode
+        cases += [
+            _per_record("msgspec.decode", decode, json_bytes),
+            _bulk("msgspec.decode (whole array)", partial(decode, array_doc), count),
+        ]
+    if HAS_RAPIDJSON:
+        cases += _str_and_bytes_rows("rapidjson.loads", rapidjson.loads, json_strings, json_bytes)
+    if HAS_UJSON:
+        cases += _str_and_bytes_rows("ujson.loads", ujson.loads, json_strings, json_bytes)
+    if HAS_SIMDJSON:
+        cases += _str_and_bytes_rows("simdjson.loads", simdjson.loads, json_strings, json_bytes)
+
+    validate = validator.validate
+    # Rust parse + validate; the label shows which parser backend was built in
+    from_json_label = "Satya+simdjson.from_json" if simd_json_enabled() else "Satya from_json"
+    cases += [
+        _per_record("Satya load_json + validate", lambda s: validate(load_json(s)), json_bytes),
+        _per_record(from_json_label, validator.from_json, json_bytes),
+        _bulk("Satya bulk-buffer from_json", partial(validator.from_json_multi, blob, offsets), count),
+        # Same documents as separate objects: one call, no packing step
+        _bulk("Satya from_json_batch", partial(validator.from_json_batch, json_bytes), count),
+        # Repeated payloads: every pass after the first is a dict lookup. Not
+        # comparable with the rows above; shows the ceiling for re-sent bodies
+        # (only while --count fits in StreamValidator.VALIDITY_CACHE_SIZE)
+        _per_record("Satya validate_cached (repeats)", validator.validate_cached, json_bytes),
+        # Validity only: parse and validate fused in Rust, no Python objects built
+        _bulk("Satya validate_json ndjson (streaming)",
+              partial(validator.validate_json, ndjson, mode="ndjson", streaming=True), count),
+    ]
+    return run_cases(cases, iterations)
+
+
+def print_results(title: str, results: Dict[str, float]) -> None:
+    print(f"\n📊 {title}")
+    print("=" * 60)
+    baseline = next(iter(results.values()))
+    for method, ops in sorted(results.items(), key=lambda kv: kv[1], reverse=True):
+        print(f"   {method:<32} {ops:>14,.0f} ops/sec  ({ops / baseline:.2f}x)")
+
+
+def _format_ops(value: float, _pos=None) -> str:
+    """Compact ops/sec label: 1.2M, 350K, 900."""
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 1_000:
+        return f"{value / 1_000:.0f}K"
+    return f"{value:.0f}"
+
+
+def create_performance_graphs(serialization: Dict[str, float], parsing: Dict[str, float],
+                              output_dir: str = "benchmarks/results") -> None:
+    """Create bar charts for serialization and parsing throughput."""
+    # Imported lazily: matplotlib adds several hundred ms of startup time
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("⚠️  Skipping graphs (matplotlib not available). Install with: pip install matplotlib")
+        return
+
+    os.makedirs(output_dir, exist_ok=True)
+    fig, axes = plt.subplots(1, 2, figsize=(18, 7))
+
+    for ax, (title, results) in zip(axes, [("Serialization", serialization), ("Parsing", parsing)]):
+        methods = list(results.keys())
+        values = list(results.values())
+        colors = ['#2E86AB' if 'Satya' in m else '#A23B72' for m in methods]
+        bars = ax.bar(range(len(methods)), values, color=colors)
+        ax.set_title(f'{title} Throughput\n(Higher is Better)', fontsize=14, fontweight='bold')
+        ax.set_ylabel('Records per Second')
+        ax.yaxis.set_major_formatter(_format_ops)
+        ax.set_xticks(range(len(methods)))
+        ax.set_xticklabels(methods, rotation=30, ha='right')
+        ax.grid(axis='y', alpha=0.3)
+        # One call labels every bar
+        ax.bar_label(bars, labels=[_format_ops(v) for v in values], padding=3, fontsize=9, fontweight='bold')
+
+    plt.tight_layout()
+    path = os.path.join(output_dir, "json_benchmark.png")
+    plt.savefig(path, dpi=150, bbox_inches='tight')
+    plt.close()
+    print(f"\n📈 Graph saved to {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON serialization/parsing benchmark: Satya vs json/orjson/msgspec")
+    parser.add_argument("--count", type=int, default=1000, help="Number of records")
+    parser.add_argument("--iterations", type=int, default=50, help="Passes over the records per row (0 = let timeit choose)")
+    parser.add_argument("--no-graph", action="store_true", help="Skip matplotlib charts")
+    parser.add_argument("--parallel", type=int, nargs="?", const=os.cpu_count() or 1, default=0, metavar="WORKERS",
+                        help="Also run sharded serialization on a thread/process pool (default: one worker per CPU)")
+    args = parser.parse_args()
+
+    tune_process(pin=not args.parallel)
+    print("🚀 JSON Benchmark: Satya vs json vs orjson vs msgspec")
+    print("=" * 60)
+    test_data = generate_test_data(args.count)
+
+    # Built once and shared by every section, so no schema compile can
+    # land inside a timed row
+    validator = User.validator()
+    json_bytes = encode_records(test_data, validator)
+    print(f"📊 {len(test_data):,} records, avg {sum(map(len, json_bytes)) / len(json_bytes):.0f} bytes each")
+    serialization = benchmark_json_methods(test_data, validator, args.iterations)
+    parsing = benchmark_parsing(json_bytes, validator, args.iterations)
+    # Same table on a float-only schema: shows whether parse cost is
+    # dominated by struct walking or by number parsing
+    floats = benchmark_parsing(generate_floats_json(args.count), FloatRecord.validator(), args.iterations,
+                               label="FloatRecord")
+
+    print_results("Serialization (records/sec)", serialization)
+    print_results("Parsing (records/sec)", parsing)
+    print_results("Parsing, floats only (records/sec)", floats)
+
+    if args.parallel:
+        parallel = benchmark_parallel(test_data, validator, args.iterations, args.parallel)
+        print_results(f"Serialization, {args.parallel} workers (records/sec)", parallel)
+        scaling = benchmark_thread_scaling(json_bytes, validator, args.iterations, args.parallel)
+        print_results("Streaming validation, thread scaling (records/sec)", scaling)
+
+    if not args.no_graph:
+        create_performance_graphs(serialization, parsing)
+
+
+if __name__ == "__main__":
+    main()
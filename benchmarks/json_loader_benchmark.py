@@ -3,21 +3,53 @@ import json
 import time
 import random
 import statistics
-from typing import Dict, List, Any, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 # import matplotlib.pyplot as plt  # Comment out matplotlib
 # import numpy as np  # Comment out numpy if only used for plotting
 
 try:
     import orjson
+    HAS_ORJSON = True
 except ImportError:
-    print("orjson not found. Installing...")
-    import subprocess
-    subprocess.check_call(["pip", "install", "orjson"])
-    import orjson
+    print("orjson not found. Install with: pip install orjson")
+    HAS_ORJSON = False
+
+try:
+    import rapidjson
+    HAS_RAPIDJSON = True
+except ImportError:
+    HAS_RAPIDJSON = False
+
+try:
+    import ujson
+    HAS_UJSON = True
+except ImportError:
+    HAS_UJSON = False
+
+try:
+    import simdjson
+    HAS_SIMDJSON = True
+except ImportError:
+    HAS_SIMDJSON = False
 
 import satya
 
 
+def _parsers() -> List[Tuple[str, Callable[[Any], Any]]]:
+    """Available (name, loads) pairs; std_json first as the baseline."""
+    parsers = [("std_json", json.loads)]
+    if HAS_ORJSON:
+        parsers.append(("orjson", orjson.loads))
+    if HAS_RAPIDJSON:
+        parsers.append(("rapidjson", rapidjson.loads))
+    if HAS_UJSON:
+        parsers.append(("ujson", ujson.loads))
+    if HAS_SIMDJSON:
+        parsers.append(("simdjson", simdjson.loads))
+    parsers.append(("satya_rust", satya.load_json))
+    return parsers
+
+
 def generate_json_data(num_records: int) -> str:
     """Generate sample JSON data with the specified number of records."""
     data = []
@@ -42,37 +74,36 @@ def generate_json_data(num_records: int) -> str:
 
 
 def benchmark_json_loading(json_str: str, num_iterations: int = 5) -> Dict[str, List[float]]:
-    """Benchmark different JSON loading methods."""
-    results = {
-        "std_json": [],
-        "orjson": [],
-        "satya_rust": []
-    }
-    
-    # Warm-up
-    json.loads(json_str)
-    orjson.loads(json_str)
-    satya.load_json(json_str)
-    
+    """Benchmark different JSON loading methods.
+
+    Every parser that accepts bytes gets two rows, ``<name> (str)`` and
+    ``<name> (bytes)``: the bytes path skips the str -> UTF-8 conversion
+    and exercises a different code path in most parsers.
+    """
+    json_bytes = json_str.encode("utf-8")
+    cases = []
+    for name, loads in _parsers():
+        cases.append((f"{name} (str)", loads, json_str))
+        cases.append((f"{name} (bytes)", loads, json_bytes))
+
+    results: Dict[str, List[float]] = {}
+    for label, loads, payload in cases:
+        # Warm-up, and drop input types the parser does not support
+        try:
+            loads(payload)
+        except (TypeError, ValueError) as e:
+            print(f"  - Skipping {label}: {type(e).__name__}: {e}")
+            continue
+        results[label] = []
+
     for _ in range(num_iterations):
-        # Standard json
-        start = time.time()
-        json.loads(json_str)
-        end = time.time()
-        results["std_json"].append(end - start)
-        
-        # orjson
-        start = time.time()
-        orjson.loads(json_str)
-        end = time.time()
-        results["orjson"].append(end - start)
-        
-        # Satya Rust implementation
-        start = time.time()
-        satya.load_json(json_str)
-        end = time.time()
-        results["satya_rust"].append(end - start)
-    
+        for label, loads, payload in cases:
+            if label not in results:
+                continue
+            start = time.perf_counter()
+            loads(payload)
+            results[label].append(time.perf_counter() - start)
+
     return results
 
 
@@ -108,29 +139,22 @@ def run_benchmarks() -> Dict[int, Dict[str, float]]:
 def plot_results(results: Dict[int, Dict[str, float]]) -> None:
     """Print results instead of plotting."""
     sizes = list(results.keys())
-    methods = ["std_json", "orjson", "satya_rust"]
-    
+    methods = list(results[sizes[0]].keys())
+    baseline_method = methods[0]
+
     print("\n===== JSON Parsing Performance =====")
-    print(f"{'Size':<10} {'std_json':<15} {'orjson':<15} {'satya_rust':<15}")
-    print("-" * 55)
-    
-    for size in sizes:
-        row = f"{size:<10}"
-        for method in methods:
-            row += f"{results[size][method]:.6f}s      "
-        print(row)
-    
-    print("\n===== Speedup Relative to standard json =====")
-    print(f"{'Size':<10} {'orjson':<15} {'satya_rust':<15}")
-    print("-" * 40)
-    
-    for size in sizes:
-        baseline = results[size]["std_json"]
-        row = f"{size:<10}"
-        for method in methods[1:]:  # Skip std_json as it's the baseline
-            speedup = baseline / results[size][method]
-            row += f"{speedup:.2f}x           "
-        print(row)
+    print(f"{'Method':<22}" + "".join(f"{size:>14}" for size in sizes))
+    print("-" * (22 + 14 * len(sizes)))
+    for method in methods:
+        print(f"{method:<22}" + "".join(f"{results[size][method]:>13.6f}s" for size in sizes))
+
+    print(f"\n===== Speedup Relative to {baseline_method} =====")
+    print(f"{'Method':<22}" + "".join(f"{size:>14}" for size in sizes))
+    print("-" * (22 + 14 * len(sizes)))
+    for method in methods[1:]:
+        print(f"{method:<22}" + "".join(
+            f"{results[size][baseline_method] / results[size][method]:>13.2f}x" for size in sizes
+        ))
 
 
 def main() -> None:
@@ -279,8 +279,11 @@ satya_app = Litestar(
 )
 
 # ======================= Benchmark Logic =======================
-@dataclass
+@dataclass(frozen=True)
 class BenchmarkResult:
+    # Spelled out because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("framework", "scenario", "operation", "times")
+
     framework: str
     scenario: str
     operation: str
@@ -11,7 +11,7 @@ import time
 import sys
 import os
 import statistics
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from decimal import Decimal
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
@@ -126,13 +126,14 @@ if pydantic_available:
     print(f"Pydantic (iterate):        {pydantic_batch:>15,.0f} ops/sec")
 
 if msgspec_available:
-    # msgspec doesn't have batch validation for dicts
+    # msgspec.convert type-checks the whole list of dicts in C, without the
+    # per-record **kwargs call (the constructor does not validate types)
     msgspec_batch = benchmark(
         "msgspec",
-        lambda: [MsgspecUser(**x) for x in data],
+        lambda: msgspec.convert(data, type=List[MsgspecUser]),
         BATCH_SIZE
     )
-    print(f"msgspec (iterate):         {msgspec_batch:>15,.0f} ops/sec")
+    print(f"msgspec convert():         {msgspec_batch:>15,.0f} ops/sec")
 
 # Test 3: With Constraints
 print("\n" + "=" * 90)
@@ -153,16 +154,14 @@ if pydantic_available:
         email: str
 
 if msgspec_available:
+    from msgspec import Meta
+
+    # Constraints as msgspec.Meta so they are checked in C, like Satya's in
+    # Rust. Meta is only enforced when converting/decoding, not by __init__.
     class MsgspecConstrained(msgspec.Struct):
-        name: str
-        age: int
-        email: str
-        
-        def __post_init__(self):
-            if not (1 <= len(self.name) <= 50):
-                raise ValueError("name length")
-            if not (0 <= self.age <= 120):
-                raise ValueError("age range")
+        name: Annotated[str, Meta(min_length=1, max_length=50)]
+        age: Annotated[int, Meta(ge=0, le=120)]
+        email: Annotated[str, Meta(pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")]
 
 satya_const_validator = SatyaConstrained.validator()
 satya_const = benchmark(
@@ -183,7 +182,7 @@ if pydantic_available:
 if msgspec_available:
     msgspec_const = benchmark(
         "msgspec",
-        lambda: [MsgspecConstrained(**x) for x in data],
+        lambda: msgspec.convert(data, type=List[MsgspecConstrained]),
         BATCH_SIZE
     )
     print(f"msgspec:           {msgspec_const:>15,.0f} ops/sec")
@@ -215,7 +214,7 @@ Test 3: With Constraints
 1. msgspec is FASTEST for simple model creation (no constraints)
    - C implementation with __slots__
    - Minimal overhead
-   - But: No built-in constraints!
+   - But: constraints (msgspec.Meta) only apply on decode/convert
 
 2. Satya DOMINATES for batch validation
    - 10x faster than Pydantic
@@ -225,7 +224,7 @@ Test 3: With Constraints
 3. Satya DOMINATES with constraints
    - 5-7x faster than Pydantic
    - Built-in constraint validation
-   - msgspec requires manual validation
+   - msgspec checks Meta constraints only on decode/convert
 
 🎯 RECOMMENDATION:
 --------------------------------------------------------------------------------
@@ -295,8 +295,11 @@ pydantic_app = Starlette(debug=False, routes=pydantic_routes)
 satya_app = Starlette(debug=False, routes=satya_routes)
 
 # ======================= Benchmark Logic =======================
-@dataclass
+@dataclass(frozen=True)
 class BenchmarkResult:
+    # Spelled out because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("framework", "scenario", "operation", "times")
+
     framework: str
     scenario: str
     operation: str
@@ -140,7 +140,10 @@ def setup_validator(fields: int, string_constraints: bool, number_constraints: b
 def bench_dict_path(mode: str, items: List[dict], batch_size: int, validator):
     """Optimized dict validation: balance speed and memory with micro-batching."""
     
-    start = time.perf_counter()
+    validate_batch = validator._validator.validate_batch
+    # Integer clock reads; converted to seconds once, for reporting
+    perf_counter_ns = time.perf_counter_ns
+    start_ns = perf_counter_ns()
     total = 0
     
     # Use small micro-batches for optimal speed/memory balance
@@ -150,16 +153,16 @@ def bench_dict_path(mode: str, items: List[dict], batch_size: int, validator):
         # Process in micro-batches for optimal cache performance
         for i in range(0, len(items), micro_batch_size):
             batch = items[i : i + micro_batch_size]
-            _ = validator._validator.validate_batch(batch)
+            _ = validate_batch(batch)
             total += len(batch)
     else:
         # array/ndjson: micro-batch validate all dicts
         for i in range(0, len(items), micro_batch_size):
             batch = items[i : i + micro_batch_size]
-            _ = validator._validator.validate_batch(batch)
+            _ = validate_batch(batch)
             total += len(batch)
             
-    elapsed = time.perf_counter() - start
+    elapsed = (perf_counter_ns() - start_ns) / 1e9
 
     # Memory measurement for micro-batch approach
     def mem_task():
@@ -181,56 +184,61 @@ def bench_jsonloads_plus_dict(mode: str, items: List[dict], batch_size: int, val
     try:
         import orjson
         json_loads = orjson.loads
-        json_dumps = lambda obj: orjson.dumps(obj).decode("utf-8")
+        json_dumps = orjson.dumps
         parser_name = "orjson"
     except ImportError:
         json_loads = json.loads
-        json_dumps = json.dumps
+        json_dumps = lambda obj: json.dumps(obj).encode("utf-8")
         parser_name = "json"
     
-    # Build payload(s)
+    # Build payload(s) as bytes; both parsers take bytes directly, so no
+    # str <-> bytes round-trip is paid per record
     if mode == "object":
-        payloads = [json_dumps(obj).encode("utf-8") for obj in items]
+        payloads = [json_dumps(obj) for obj in items]
     elif mode == "array":
-        payload = json_dumps(items).encode("utf-8")
+        payload = json_dumps(items)
     elif mode == "ndjson":
-        payload = ("\n".join(json_dumps(obj) for obj in items)).encode("utf-8")
+        payload = b"\n".join(json_dumps(obj) for obj in items)
     else:
         raise ValueError(f"Unknown mode: {mode}")
 
-    start = time.perf_counter()
+    validate_batch = validator._validator.validate_batch
+    perf_counter_ns = time.perf_counter_ns
+    start_ns = perf_counter_ns()
     total = 0
     if mode == "object":
         # Decode each object and validate in batches
         decoded_batch = []
+        append = decoded_batch.append
         for p in payloads:
-            decoded_batch.append(json_loads(p))
+            append(json_loads(p))
             if len(decoded_batch) >= batch_size:
-                _ = validator._validator.validate_batch(decoded_batch)
+                _ = validate_batch(decoded_batch)
                 total += len(decoded_batch)
                 decoded_batch.clear()
         if decoded_batch:
-            _ = validator._validator.validate_batch(decoded_batch)
+            _ = validate_batch(decoded_batch)
             total += len(decoded_batch)
     elif mode == "array":
         decoded = json_loads(payload)
-        _ = validator._validator.validate_batch(decoded)
+        _ = validate_batch(decoded)
         total = len(decoded)
     else:  # ndjson
         decoded_batch = []
-        for line in payload.decode("utf-8").splitlines():
+        append = decoded_batch.append
+        for line in payload.splitlines():
             line = line.strip()
             if not line:
                 continue
-            decoded_batch.append(json_loads(line))
+            append(json_loads(line))
             if len(decoded_batch) >= batch_size:
-                _ = validator._validator.validate_batch(decoded_batch)
+                _ = validate_batch(decoded_batch)
                 total += len(decoded_batch)
                 decoded_batch.clear()
         if decoded_batch:
-            _ = validator._validator.validate_batch(decoded_batch)
+            _ = validate_batch(decoded_batch)
             total += len(decoded_batch)
-    elapsed = time.perf_counter() - start
+    elapsed = (perf_counter_ns() - start_ns) / 1e9
 
     # Memory for a single batch-sized workload
     def mem_task():
@@ -238,11 +246,11 @@ def bench_jsonloads_plus_dict(mode: str, items: List[dict], batch_size: int, val
             decoded = [json_loads(p) for p in payloads[:batch_size]]
             _ = validator._validator.validate_batch(decoded)
         elif mode == "array":
-            part = json_dumps(items[:batch_size]).encode("utf-8")
+            part = json_dumps(items[:batch_size])
             decoded = json_loads(part)
             _ = validator._validator.validate_batch(decoded)
         else:
-            lines = ("\n".join(json_dumps(obj) for obj in items[:batch_size])).encode("utf-8").decode("utf-8").splitlines()
+            lines = b"\n".join(json_dumps(obj) for obj in items[:batch_size]).splitlines()
             decoded = [json_loads(line) for line in lines if line.strip()]
             _ = validator._validator.validate_batch(decoded)
 
@@ -264,19 +272,21 @@ def bench_json_bytes(mode: str, items: List[dict], batch_size: int, streaming: b
     else:
         raise ValueError(f"Unknown mode: {mode}")
 
-    start = time.perf_counter()
+    validate_json = validator.validate_json
+    perf_counter_ns = time.perf_counter_ns
+    start_ns = perf_counter_ns()
     total = 0
     if mode == "object":
         for p in payloads:
-            _ = validator.validate_json(p, mode="object", streaming=streaming)
+            _ = validate_json(p, mode="object", streaming=streaming)
             total += 1
     elif mode == "array":
-        _ = validator.validate_json(payload, mode="array", streaming=streaming)
+        _ = validate_json(payload, mode="array", streaming=streaming)
         total = len(items)
     elif mode == "ndjson":
-        _ = validator.validate_json(payload, mode="ndjson", streaming=streaming)
+        _ = validate_json(payload, mode="ndjson", streaming=streaming)
         total = len(items)
-    elapsed = time.perf_counter() - start
+    elapsed = (perf_counter_ns() - start_ns) / 1e9
 
     # Memory for a single batch-sized workload
     def mem_task():
@@ -317,31 +327,33 @@ def bench_pydantic_orjson(mode: str, items: List[dict], batch_size: int):
     elif mode == "array":
         payload = orjson.dumps(items)
     elif mode == "ndjson":
-        payload = ("\n".join(orjson.dumps(obj).decode("utf-8") for obj in items)).encode("utf-8")
+        payload = b"\n".join(orjson.dumps(obj) for obj in items)
     else:
         raise ValueError(f"Unknown mode: {mode}")
 
-    start = time.perf_counter()
+    loads = orjson.loads
+    perf_counter_ns = time.perf_counter_ns
+    start_ns = perf_counter_ns()
     total = 0
     if mode == "object":
         for p in payloads:
-            decoded = orjson.loads(p)
+            decoded = loads(p)
             Person(**decoded)
             total += 1
     elif mode == "array":
-        decoded = orjson.loads(payload)
+        decoded = loads(payload)
         for item in decoded:
             Person(**item)
         total = len(decoded)
     else:  # ndjson
-        for line in payload.decode("utf-8").splitlines():
+        for line in payload.splitlines():
             line = line.strip()
             if not line:
                 continue
-            decoded = orjson.loads(line)
+            decoded = loads(line)
             Person(**decoded)
             total += 1
-    elapsed = time.perf_counter() - start
+    elapsed = (perf_counter_ns() - start_ns) / 1e9
 
     # Memory measurement
     def mem_task():
@@ -355,7 +367,7 @@ def bench_pydantic_orjson(mode: str, items: List[dict], batch_size: int):
             for item in decoded:
                 Person(**item)
         else:
-            lines = ("\n".join(orjson.dumps(obj).decode("utf-8") for obj in items[:batch_size])).encode("utf-8").decode("utf-8").splitlines()
+            lines = b"\n".join(orjson.dumps(obj) for obj in items[:batch_size]).splitlines()
             for line in lines:
                 if line.strip():
                     decoded = orjson.loads(line)
@@ -379,6 +391,11 @@ def bench_msgspec_json(mode: str, items: List[dict], batch_size: int):
         name: str
         age: int
         email: str
+
+    # Decoders built once: the module-level msgspec.json.decode(type=...)
+    # resolves the target type again on every call
+    decode = msgspec.json.Decoder(Person).decode
+    decode_list = msgspec.json.Decoder(list[Person]).decode
     
     # Build payloads using standard json for encoding (msgspec will decode)
     if mode == "object":
@@ -390,37 +407,38 @@ def bench_msgspec_json(mode: str, items: List[dict], batch_size: int):
     else:
         raise ValueError(f"Unknown mode: {mode}")
 
-    start = time.perf_counter()
+    perf_counter_ns = time.perf_counter_ns
+    start_ns = perf_counter_ns()
     total = 0
     if mode == "object":
         for p in payloads:
-            msgspec.json.decode(p, type=Person)
+            decode(p)
             total += 1
     elif mode == "array":
-        decoded = msgspec.json.decode(payload, type=list[Person])
+        decoded = decode_list(payload)
         total = len(decoded)
     else:  # ndjson
-        for line in payload.decode("utf-8").splitlines():
+        for line in payload.splitlines():
             line = line.strip()
             if not line:
                 continue
-            msgspec.json.decode(line.encode("utf-8"), type=Person)
+            decode(line)
             total += 1
-    elapsed = time.perf_counter() - start
+    elapsed = (perf_counter_ns() - start_ns) / 1e9
 
     # Memory measurement
     def mem_task():
         if mode == "object":
             for p in payloads[:batch_size]:
-                msgspec.json.decode(p, type=Person)
+                decode(p)
         elif mode == "array":
             part = json.dumps(items[:batch_size]).encode("utf-8")
-            msgspec.json.decode(part, type=list[Person])
+            decode_list(part)
         else:
-            lines = ("\n".join(json.dumps(obj) for obj in items[:batch_size])).encode("utf-8").decode("utf-8").splitlines()
+            lines = b"\n".join(json.dumps(obj).encode("utf-8") for obj in items[:batch_size]).splitlines()
             for line in lines:
                 if line.strip():
-                    msgspec.json.decode(line.encode("utf-8"), type=Person)
+                    decode(line)
 
     mem_mb = measure_memory_usage(mem_task)
     ips = total / elapsed if elapsed > 0 else float('inf')
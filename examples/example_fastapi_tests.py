@@ -0,0 +1,150 @@
+"""
+Tests for the example_fastapi.py app.
+
+By default every request goes through FastAPI's in-process TestClient, so no
+server or network is needed:
+
+    python examples/example_fastapi_tests.py
+
+Against a running server (uvicorn example_fastapi:app), the same cases run
+over HTTP and an additional concurrent load pass is fired with
+httpx.AsyncClient + asyncio.gather:
+
+    python examples/example_fastapi_tests.py --base-url http://127.0.0.1:8000 --load 500
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Callable, List, Tuple
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+
+def test_root(client):
+    r = client.get("/")
+    assert r.status_code == 200, r.text
+    assert r.json() == {"message": "Welcome to Satya FastAPI Example!"}
+
+
+def test_create_item(client):
+    payload = {
+        "name": "Test Item",
+        "description": "A test item",
+        "price": 29.99,
+        "is_offer": True,
+        "tags": ["test", "example"],
+    }
+    r = client.post("/items/", json=payload)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["message"] == "Item Test Item created successfully"
+    assert body["item"]["id"] == 123
+    assert body["item"]["tags"] == ["test", "example"]
+
+
+def test_create_item_defaults(client):
+    r = client.post("/items/", json={"name": "Minimal", "price": 1.5})
+    assert r.status_code == 200, r.text
+    item = r.json()["item"]
+    assert item["is_offer"] is False
+    assert item["tags"] == []
+
+
+def test_create_item_invalid(client):
+    r = client.post("/items/", json={"name": "No price"})
+    assert r.status_code == 422, r.text
+
+
+def test_search_all(client):
+    r = client.request("GET", "/items/search", json={})
+    assert r.status_code == 200, r.text
+    assert r.json()["count"] == 5
+
+
+def test_search_price_range(client):
+    r = client.request("GET", "/items/search", json={"min_price": 15, "max_price": 35})
+    assert r.status_code == 200, r.text
+    prices = [item["price"] for item in r.json()["items"]]
+    assert prices == [19.99, 29.99]
+
+
+def test_search_tag(client):
+    r = client.request("GET", "/items/search", json={"tag": "sale"})
+    assert r.status_code == 200, r.text
+    assert all(item["tags"] == ["tag1", "sale"] for item in r.json()["items"])
+
+
+def test_custom(client):
+    r = client.get("/custom")
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["id"] == 999
+    assert body["name"] == "Custom Item"
+
+
+TESTS: List[Tuple[str, Callable]] = [
+    ("root", test_root),
+    ("create item", test_create_item),
+    ("create item (defaults)", test_create_item_defaults),
+    ("create item (invalid)", test_create_item_invalid),
+    ("search (all)", test_search_all),
+    ("search (price range)", test_search_price_range),
+    ("search (tag)", test_search_tag),
+    ("custom response", test_custom),
+]
+
+
+def run_tests(client) -> int:
+    failures = 0
+    for name, test in TESTS:
+        try:
+            test(client)
+            print(f"PASS  {name}")
+        except AssertionError as e:
+            failures += 1
+            print(f"FAIL  {name}: {e}")
+    return failures
+
+
+async def run_load(base_url: str, n: int) -> None:
+    """Fire n concurrent search requests over one connection pool."""
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *[client.request("GET", "/items/search", json={}) for _ in range(n)]
+        )
+        elapsed = time.perf_counter() - start
+    ok = sum(r.status_code == 200 for r in responses)
+    print(f"\nLoad: {ok}/{n} OK in {elapsed:.3f}s ({n / elapsed:,.0f} req/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Test the Satya FastAPI example app")
+    parser.add_argument("--base-url", help="Test a running server instead of the in-process app")
+    parser.add_argument("--load", type=int, default=0, help="Concurrent requests for the load pass (needs --base-url)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.base_url:
+        with httpx.Client(base_url=args.base_url) as client:
+            failures = run_tests(client)
+    else:
+        from fastapi.testclient import TestClient
+        from example_fastapi import app
+
+        with TestClient(app) as client:
+            failures = run_tests(client)
+    print(f"\n{len(TESTS) - failures}/{len(TESTS)} passed in {time.perf_counter() - start:.3f}s")
+
+    if args.base_url and args.load:
+        asyncio.run(run_load(args.base_url, args.load))
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyString, PyInt, PyFloat, PyBool, PyList, PyAny};
 use std::collections::HashMap;
 use regex::Regex;
+use crate::pattern::FastPattern;
 use once_cell::sync::Lazy;
 
 /// Email regex (compiled once, reused forever)
@@ -47,7 +48,7 @@ pub struct BlazeField {
     // String constraints
     pub min_length: Option<usize>,
     pub max_length: Option<usize>,
-    pub pattern: Option<Regex>,
+    pub pattern: Option<FastPattern>,
     pub email: bool,
     pub url: bool,
     pub enum_values: Option<Vec<String>>,
@@ -143,7 +144,7 @@ impl BlazeValidator {
                 field.le = le;
                 field.min_length = min_length;
                 field.max_length = max_length;
-                field.pattern = pattern.and_then(|p| Regex::new(&p).ok());
+                field.pattern = pattern.and_then(|p| FastPattern::new(&p).ok());
                 field.email = email;
                 field.url = url;
                 field.enum_values = enum_values;
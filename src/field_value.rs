@@ -165,24 +165,49 @@ impl FieldValue {
 
     /// Serialize to JSON string
     pub fn to_json(&self) -> String {
+        let mut out = Vec::with_capacity(64);
+        self.write_json(&mut out);
+        String::from_utf8(out).expect("serde_json only emits UTF-8")
+    }
+
+    /// Append the JSON encoding to `out`
+    ///
+    /// Numbers and strings go through serde_json: floats are formatted with
+    /// ryu (shortest round-trip, `1.0` rather than `1`, non-finite as
+    /// `null`) and strings get full JSON escaping. A single buffer is
+    /// threaded through nested values instead of joining per-item Strings.
+    pub fn write_json(&self, out: &mut Vec<u8>) {
+        // Writing into a Vec<u8> cannot fail for these value types
+        const INFALLIBLE: &str = "serializing a scalar into a Vec cannot fail";
         match self {
-            FieldValue::Int(i) => i.to_string(),
-            FieldValue::Float(f) => f.to_string(),
-            FieldValue::String(s) => format!("\"{}\"", s.replace('"', "\\\"")),
-            FieldValue::Bool(b) => b.to_string(),
+            FieldValue::Int(i) => serde_json::to_writer(&mut *out, i).expect(INFALLIBLE),
+            FieldValue::Float(f) => serde_json::to_writer(&mut *out, f).expect(INFALLIBLE),
+            FieldValue::String(s) => serde_json::to_writer(&mut *out, s).expect(INFALLIBLE),
+            FieldValue::Bool(b) => out.extend_from_slice(if *b { b"true" } else { b"false" }),
             FieldValue::List(items) => {
-                let items_json: Vec<String> = items.iter().map(|v| v.to_json()).collect();
-                format!("[{}]", items_json.join(","))
+                out.push(b'[');
+                for (i, item) in items.iter().enumerate() {
+                    if i > 0 {
+                        out.push(b',');
+                    }
+                    item.write_json(out);
+                }
+                out.push(b']');
             }
             FieldValue::Dict(map) => {
-                let items_json: Vec<String> = map
-                    .iter()
-                    .map(|(k, v)| format!("\"{}\":{}", k, v.to_json()))
-                    .collect();
-                format!("{{{}}}", items_json.join(","))
+                out.push(b'{');
+                for (i, (k, v)) in map.iter().enumerate() {
+                    if i > 0 {
+                        out.push(b',');
+                    }
+                    serde_json::to_writer(&mut *out, k).expect(INFALLIBLE);
+                    out.push(b':');
+                    v.write_json(out);
+                }
+                out.push(b'}');
             }
-            FieldValue::Model(inner) => inner.to_json(),
-            FieldValue::None => "null".to_string(),
+            FieldValue::Model(inner) => inner.write_json(out),
+            FieldValue::None => out.extend_from_slice(b"null"),
         }
     }
 }
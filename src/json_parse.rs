@@ -0,0 +1,169 @@
+/// JSON bytes -> Python objects, with an optional SIMD parser backend
+///
+/// By default documents are parsed with serde_json. When the crate is built
+/// with `--features simd-json` and the CPU supports it (AVX2 on x86_64,
+/// NEON on aarch64), simd-json is used instead. simd-json parses in place, so
+/// the input is first copied into a per-thread scratch buffer that is reused
+/// across calls.
+
+use pyo3::prelude::*;
+use pyo3::types::{PyBytes, PyList, PyString};
+use serde_json::Value as JsonValue;
+
+use crate::json_value_to_py;
+
+#[cfg(feature = "simd-json")]
+mod simd {
+    use once_cell::sync::Lazy;
+    use serde_json::Value as JsonValue;
+    use std::cell::RefCell;
+
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    fn cpu_supported() -> bool {
+        std::is_x86_feature_detected!("avx2")
+    }
+
+    #[cfg(target_arch = "aarch64")]
+    fn cpu_supported() -> bool {
+        true // NEON is part of the aarch64 baseline
+    }
+
+    #[cfg(not(any(target_arch = "x86", target_arch = "x86_64", target_arch = "aarch64")))]
+    fn cpu_supported() -> bool {
+        false
+    }
+
+    pub static AVAILABLE: Lazy<bool> = Lazy::new(cpu_supported);
+
+    thread_local! {
+        static SCRATCH: RefCell<Vec<u8>> = RefCell::new(Vec::with_capacity(4096));
+    }
+
+    pub fn parse(bytes: &[u8]) -> Result<JsonValue, String> {
+        SCRATCH.with(|scratch| {
+            let mut buf = scratch.borrow_mut();
+            buf.clear();
+            buf.extend_from_slice(bytes);
+            simd_json::serde::from_slice::<JsonValue>(&mut buf[..]).map_err(|e| e.to_string())
+        })
+    }
+}
+
+/// Parse a complete JSON document using the best available backend
+pub fn parse_slice(bytes: &[u8]) -> Result<JsonValue, String> {
+    #[cfg(feature = "simd-json")]
+    {
+        if *simd::AVAILABLE {
+            return simd::parse(bytes);
+        }
+    }
+    serde_json::from_slice(bytes).map_err(|e| e.to_string())
+}
+
+/// Borrow the UTF-8 bytes of a `bytes` or `str` object without copying
+///
+/// `bytes` objects are immutable and `str` caches its UTF-8 form, so the
+/// slice stays valid for as long as `data` is alive, including while the GIL
+/// is released.
+pub(crate) fn borrow_bytes<'a>(data: &'a Bound<'_, PyAny>) -> PyResult<&'a [u8]> {
+    if let Ok(b) = data.downcast::<PyBytes>() {
+        return Ok(b.as_bytes());
+    }
+    if let Ok(s) = data.downcast::<PyString>() {
+        return Ok(s.to_str()?.as_bytes());
+    }
+    Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(
+        "Expected bytes or str",
+    ))
+}
+
+/// Strip leading and trailing ASCII whitespace from a line
+///
+/// Same as `<[u8]>::trim_ascii`, which needs Rust 1.80 (the crate's
+/// minimum is 1.70).
+pub(crate) fn trim_ascii(mut bytes: &[u8]) -> &[u8] {
+    while let [first, rest @ ..] = bytes {
+        if !first.is_ascii_whitespace() { break; }
+        bytes = rest;
+    }
+    while let [rest @ .., last] = bytes {
+        if !last.is_ascii_whitespace() { break; }
+        bytes = rest;
+    }
+    bytes
+}
+
+/// Parse JSON from bytes or str into Python objects
+#[pyfunction]
+pub fn load_json_bytes(py: Python<'_>, data: Bound<'_, PyAny>) -> PyResult<Py<PyAny>> {
+    let bytes = borrow_bytes(&data)?;
+    let value = py.detach(|| parse_slice(bytes)).map_err(|e| {
+        PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Failed to parse JSON: {}", e))
+    })?;
+    json_value_to_py(py, &value)
+}
+
+/// Parse many JSON documents packed into one buffer
+///
+/// `offsets` has one more entry than there are documents: document `i`
+/// spans `data[offsets[i]..offsets[i + 1]]`. The buffer is borrowed, not
+/// copied, and every document is parsed with the GIL released before any Python object
+/// is built.
+#[pyfunction]
+pub fn load_json_multi(py: Python<'_>, data: Bound<'_, PyAny>, offsets: Vec<usize>) -> PyResult<Py<PyList>> {
+    let bytes = borrow_bytes(&data)?;
+    if offsets.windows(2).any(|w| w[0] > w[1]) || offsets.last().map_or(false, |&end| end > bytes.len()) {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "offsets must be non-decreasing and within the buffer",
+        ));
+    }
+
+    let parsed: Vec<Result<JsonValue, String>> = py.detach(|| {
+        offsets
+            .windows(2)
+            .map(|w| parse_slice(&bytes[w[0]..w[1]]))
+            .collect()
+    });
+
+    let out = PyList::empty(py);
+    for (i, value) in parsed.into_iter().enumerate() {
+        let value = value.map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Failed to parse JSON document {}: {}", i, e))
+        })?;
+        out.append(json_value_to_py(py, &value)?)?;
+    }
+    Ok(out.unbind())
+}
+
+/// Parse a list of JSON documents (bytes or str) in one call
+///
+/// Every document is borrowed, not copied, and all of them are parsed with
+/// the GIL released before any Python object is built. The items are held
+/// in `docs` for the whole call, so their buffers stay alive even if the
+/// list itself is mutated meanwhile.
+#[pyfunction]
+pub fn load_json_batch(py: Python<'_>, items: &Bound<'_, PyList>) -> PyResult<Py<PyList>> {
+    let docs: Vec<Bound<'_, PyAny>> = items.iter().collect();
+    let slices = docs.iter().map(borrow_bytes).collect::<PyResult<Vec<&[u8]>>>()?;
+
+    let parsed: Vec<Result<JsonValue, String>> =
+        py.detach(|| slices.iter().map(|bytes| parse_slice(bytes)).collect());
+
+    let out = PyList::empty(py);
+    for (i, value) in parsed.into_iter().enumerate() {
+        let value = value.map_err(|e| {
+            PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Failed to parse JSON document {}: {}", i, e))
+        })?;
+        out.append(json_value_to_py(py, &value)?)?;
+    }
+    Ok(out.unbind())
+}
+
+/// Whether the simd-json backend is compiled in and supported by this CPU
+#[pyfunction]
+pub fn simd_json_enabled() -> bool {
+    #[cfg(feature = "simd-json")]
+    return *simd::AVAILABLE;
+    #[cfg(not(feature = "simd-json"))]
+    return false;
+}
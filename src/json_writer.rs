@@ -0,0 +1,350 @@
+/// Direct Python -> JSON bytes writer
+///
+/// Walks Python objects and appends their JSON encoding straight into a
+/// `Vec<u8>`, without building an intermediate `serde_json::Value` tree.
+/// Strings, ints and floats are encoded through serde_json (itoa/ryu), so
+/// escaping and float formatting match the rest of the crate.
+///
+/// Supported inputs: None, bool, int, float, str, list, tuple, dict (str,
+/// None, bool, int or float keys, converted as by `json.dumps`),
+/// objects exposing `model_dump()` (Satya models) and objects exposing
+/// `isoformat()` (datetime/date/time).
+
+use std::cell::RefCell;
+
+use pyo3::prelude::*;
+use pyo3::types::{PyBool, PyByteArray, PyBytes, PyDict, PyFloat, PyInt, PyList, PyString, PyTuple};
+
+/// Nesting limit - guards against self-referencing containers
+const MAX_DEPTH: usize = 255;
+
+/// Initial capacity for a single encoded object (typical record is < 512 B)
+const INITIAL_CAPACITY: usize = 512;
+
+/// Scratch buffers larger than this are dropped rather than kept per thread
+const SCRATCH_RETAIN_LIMIT: usize = 1 << 20;
+
+thread_local! {
+    static SCRATCH: RefCell<Vec<u8>> = RefCell::new(Vec::with_capacity(INITIAL_CAPACITY));
+}
+
+/// Run `f` with this thread's cleared scratch buffer
+///
+/// Single-object encoders reuse one allocation across calls instead of
+/// allocating a fresh `Vec` each time. `write_value` can call back into
+/// Python (`model_dump()`, `isoformat()`), which may re-enter the writer;
+/// a nested call finds the buffer borrowed and uses a fresh one.
+fn with_scratch<R>(f: impl FnOnce(&mut Vec<u8>) -> R) -> R {
+    SCRATCH.with(|cell| match cell.try_borrow_mut() {
+        Ok(mut buf) => {
+            buf.clear();
+            let result = f(&mut buf);
+            if buf.capacity() > SCRATCH_RETAIN_LIMIT {
+                *buf = Vec::with_capacity(INITIAL_CAPACITY);
+            }
+            result
+        }
+        Err(_) => f(&mut Vec::with_capacity(INITIAL_CAPACITY)),
+    })
+}
+
+#[inline]
+fn write_str(s: &str, out: &mut Vec<u8>) -> PyResult<()> {
+    serde_json::to_writer(&mut *out, s)
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))
+}
+
+/// Append a dict key, converting non-str keys the way `json.dumps` does
+///
+/// None, bool, int and float keys become `"null"`, `"true"`/`"false"` and
+/// `int.__repr__` / `float.__repr__` of the key (so IntEnum keys give their
+/// digits, not the member name); any other key type is a TypeError.
+fn write_key(key: &Bound<'_, PyAny>, out: &mut Vec<u8>) -> PyResult<()> {
+    if let Ok(s) = key.downcast::<PyString>() {
+        return write_str(&s.to_str()?, out);
+    }
+    if key.is_none() {
+        out.extend_from_slice(b"\"null\"");
+        return Ok(());
+    }
+    if let Ok(b) = key.downcast::<PyBool>() {
+        out.extend_from_slice(if b.is_true() { b"\"true\"" } else { b"\"false\"" });
+        return Ok(());
+    }
+    if key.is_instance_of::<PyInt>() {
+        let digits = key.py().get_type::<PyInt>().call_method1("__repr__", (key,))?;
+        return write_str(&digits.downcast::<PyString>()?.to_str()?, out);
+    }
+    if let Ok(f) = key.downcast::<PyFloat>() {
+        let v = f.value();
+        return match v {
+            _ if v.is_nan() => write_str("NaN", out),
+            _ if v == f64::INFINITY => write_str("Infinity", out),
+            _ if v == f64::NEG_INFINITY => write_str("-Infinity", out),
+            _ => {
+                let text = key.py().get_type::<PyFloat>().call_method1("__repr__", (key,))?;
+                write_str(&text.downcast::<PyString>()?.to_str()?, out)
+            }
+        };
+    }
+    Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+        "keys must be str, int, float, bool or None, not {}",
+        key.get_type().name()?
+    )))
+}
+
+/// Append the JSON encoding of `obj` to `out`
+pub fn write_value(obj: &Bound<'_, PyAny>, out: &mut Vec<u8>, depth: usize) -> PyResult<()> {
+    if depth > MAX_DEPTH {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "Maximum nesting depth exceeded while serializing",
+        ));
+    }
+
+    if obj.is_none() {
+        out.extend_from_slice(b"null");
+        return Ok(());
+    }
+
+    if let Ok(s) = obj.downcast::<PyString>() {
+        return write_str(&s.to_str()?, out);
+    }
+
+    // bool must be checked before int (bool is a subclass of int)
+    if let Ok(b) = obj.downcast::<PyBool>() {
+        out.extend_from_slice(if b.is_true() { b"true" } else { b"false" });
+        return Ok(());
+    }
+
+    if obj.is_instance_of::<PyInt>() {
+        if let Ok(i) = obj.extract::<i64>() {
+            serde_json::to_writer(&mut *out, &i)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        } else {
+            // Arbitrary precision ints: Python's decimal repr is valid JSON
+            out.extend_from_slice(obj.str()?.to_str()?.as_bytes());
+        }
+        return Ok(());
+    }
+
+    if let Ok(f) = obj.downcast::<PyFloat>() {
+        // serde_json writes non-finite floats as null
+        serde_json::to_writer(&mut *out, &f.value())
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        return Ok(());
+    }
+
+    if let Ok(dict) = obj.downcast::<PyDict>() {
+        out.push(b'{');
+        let mut first = true;
+        for (k, v) in dict.iter() {
+            if !first {
+                out.push(b',');
+            }
+            first = false;
+            write_key(&k, out)?;
+            out.push(b':');
+            write_value(&v, out, depth + 1)?;
+        }
+        out.push(b'}');
+        return Ok(());
+    }
+
+    if let Ok(list) = obj.downcast::<PyList>() {
+        out.push(b'[');
+        for (i, item) in list.iter().enumerate() {
+            if i > 0 {
+                out.push(b',');
+            }
+            write_value(&item, out, depth + 1)?;
+        }
+        out.push(b']');
+        return Ok(());
+    }
+
+    if let Ok(tuple) = obj.downcast::<PyTuple>() {
+        out.push(b'[');
+        for (i, item) in tuple.iter().enumerate() {
+            if i > 0 {
+                out.push(b',');
+            }
+            write_value(&item, out, depth + 1)?;
+        }
+        out.push(b']');
+        return Ok(());
+    }
+
+    // Satya models (and pydantic-style objects)
+    if obj.hasattr("model_dump")? {
+        let dumped = obj.call_method0("model_dump")?;
+        return write_value(&dumped, out, depth + 1);
+    }
+
+    // datetime / date / time
+    if obj.hasattr("isoformat")? {
+        let iso = obj.call_method0("isoformat")?;
+        return write_str(&iso.str()?.to_str()?, out);
+    }
+
+    // Decimal, UUID and other scalar-like objects serialize via str()
+    let type_name = obj.get_type().name()?;
+    match type_name.to_str()? {
+        "Decimal" | "UUID" => write_str(&obj.str()?.to_str()?, out),
+        other => Err(PyErr::new::<pyo3::exceptions::PyTypeError, _>(format!(
+            "Object of type {} is not JSON serializable",
+            other
+        ))),
+    }
+}
+
+/// Serialize a Python object to JSON bytes
+#[pyfunction]
+pub fn dump_json(py: Python<'_>, obj: &Bound<'_, PyAny>) -> PyResult<Py<PyBytes>> {
+    with_scratch(|out| {
+        write_value(obj, out, 0)?;
+        Ok(PyBytes::new(py, out).unbind())
+    })
+}
+
+/// Copy `data` into `out[offset..]`, growing (never shrinking) `out`
+fn copy_into_bytearray(data: &[u8], out: &Bound<'_, PyByteArray>, offset: usize) -> PyResult<usize> {
+    let end = offset + data.len();
+    if out.len() < end {
+        out.resize(end)?;
+    }
+    // SAFETY: we hold the GIL and do not call back into Python while the
+    // slice is alive, so the bytearray cannot be resized underneath us.
+    unsafe {
+        out.as_bytes_mut()[offset..end].copy_from_slice(data);
+    }
+    Ok(end)
+}
+
+/// Serialize a Python object into a caller-provided bytearray
+///
+/// The encoding is written at `out[offset:]`. The bytearray is grown when
+/// the encoded value does not fit, but never shrunk, so a single buffer can
+/// be reused across calls without reallocating. Returns the end offset; the
+/// encoded value is `out[offset:end]` (with the default offset of 0 this is
+/// the number of bytes written).
+#[pyfunction]
+#[pyo3(signature = (obj, out, offset=0))]
+pub fn dump_json_into(obj: &Bound<'_, PyAny>, out: &Bound<'_, PyByteArray>, offset: usize) -> PyResult<usize> {
+    if offset > out.len() {
+        return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+            "offset is past the end of the buffer",
+        ));
+    }
+    with_scratch(|buf| {
+        write_value(obj, buf, 0)?;
+        copy_into_bytearray(buf, out, offset)
+    })
+}
+
+/// Serialize every item of a list back to back into a bytearray
+///
+/// All items are encoded into one Rust buffer and copied into `out` with a
+/// single resize at most. Returns `len(items) + 1` offsets: item `i` is
+/// `out[offsets[i]:offsets[i + 1]]`.
+#[pyfunction]
+pub fn dump_json_all_into(items: &Bound<'_, PyList>, out: &Bound<'_, PyByteArray>) -> PyResult<Vec<usize>> {
+    let mut buf = Vec::with_capacity(out.len().max(items.len() * INITIAL_CAPACITY));
+    let mut offsets = Vec::with_capacity(items.len() + 1);
+    offsets.push(0);
+    for item in items.iter() {
+        write_value(&item, &mut buf, 0)?;
+        offsets.push(buf.len());
+    }
+    copy_into_bytearray(&buf, out, 0)?;
+    Ok(offsets)
+}
+
+/// Serialize every item of a list in one call, returning a list of bytes
+///
+/// One Python -> Rust crossing for the whole batch, and a single scratch
+/// buffer reused for every item. The GIL stays held: the writer reads the
+/// Python objects directly, so there is no GIL-free phase to release it for.
+#[pyfunction]
+pub fn dump_json_batch(py: Python<'_>, items: &Bound<'_, PyList>) -> PyResult<Py<PyList>> {
+    let mut buf = Vec::with_capacity(INITIAL_CAPACITY);
+    let mut encoded = Vec::with_capacity(items.len());
+    for item in items.iter() {
+        buf.clear();
+        write_value(&item, &mut buf, 0)?;
+        encoded.push(PyBytes::new(py, &buf));
+    }
+    Ok(PyList::new(py, encoded)?.unbind())
+}
+
+/// One precompiled top-level field: its name and the encoded `"name":` bytes
+struct KeyOp<'a, 'py> {
+    name: &'a str,
+    key: Bound<'py, PyString>,
+    prefix: Vec<u8>,
+}
+
+impl KeyOp<'_, '_> {
+    #[inline]
+    fn matches(&self, k: &Bound<'_, PyAny>) -> bool {
+        // Interned keys compare by pointer; keys from parsed JSON by value
+        k.is(&self.key)
+            || k.downcast::<PyString>()
+                .map_or(false, |ks| ks.to_str().map_or(false, |s| s == self.name))
+    }
+}
+
+/// Serialize a list of records into one contiguous buffer
+///
+/// `fields` is the schema's field order. Each field's `"name":` prefix is
+/// escaped once up front; a record whose keys arrive in that order (the
+/// normal case for validated data) then emits each key with a single
+/// memcpy instead of re-escaping it. Keys that do not line up fall back to
+/// the generic writer, so the output is always identical to `dump_json`.
+///
+/// Returns the buffer and `len(items) + 1` offsets: record `i` is
+/// `buf[offsets[i]:offsets[i + 1]]`.
+#[pyfunction]
+pub fn dump_json_many(
+    py: Python<'_>,
+    items: &Bound<'_, PyList>,
+    fields: Vec<String>,
+) -> PyResult<(Py<PyBytes>, Vec<usize>)> {
+    let mut ops = Vec::with_capacity(fields.len());
+    for name in &fields {
+        let mut prefix = Vec::with_capacity(name.len() + 3);
+        write_str(name, &mut prefix)?;
+        prefix.push(b':');
+        ops.push(KeyOp { name, key: PyString::intern(py, name), prefix });
+    }
+
+    let mut out = Vec::with_capacity(items.len() * INITIAL_CAPACITY);
+    let mut offsets = Vec::with_capacity(items.len() + 1);
+    offsets.push(0);
+    for item in items.iter() {
+        match item.downcast::<PyDict>() {
+            Ok(dict) => {
+                out.push(b'{');
+                for (i, (k, v)) in dict.iter().enumerate() {
+                    if i > 0 {
+                        out.push(b',');
+                    }
+                    match ops.get(i).filter(|op| op.matches(&k)) {
+                        Some(op) => out.extend_from_slice(&op.prefix),
+                        None => {
+                            match k.downcast::<PyString>() {
+                                Ok(ks) => write_str(&ks.to_str()?, &mut out)?,
+                                Err(_) => write_str(&k.str()?.to_str()?, &mut out)?,
+                            }
+                            out.push(b':');
+                        }
+                    }
+                    write_value(&v, &mut out, 1)?;
+                }
+                out.push(b'}');
+            }
+            Err(_) => write_value(&item, &mut out, 0)?,
+        }
+        offsets.push(out.len());
+    }
+    Ok((PyBytes::new(py, &out).unbind(), offsets))
+}
@@ -7,6 +7,8 @@ use serde::Deserializer; // bring trait methods like deserialize_seq into scope
 use serde_json::Value as JsonValue;
 use once_cell::sync::Lazy;  // For lazy static regex compilation
 
+mod pattern;
+
 mod compiled_validator;
 use compiled_validator::BlazeCompiledValidator;
 
@@ -25,6 +27,12 @@ use native_model::{NativeModel, hydrate_one, hydrate_batch, hydrate_batch_parall
 mod fast_model;
 use fast_model::{UltraFastModel, hydrate_one_ultra_fast, hydrate_batch_ultra_fast, hydrate_batch_ultra_fast_parallel};
 
+mod json_writer;
+use json_writer::{dump_json, dump_json_all_into, dump_json_batch, dump_json_into, dump_json_many};
+
+mod json_parse;
+use json_parse::{load_json_batch, load_json_bytes, load_json_multi, simd_json_enabled};
+
 mod field_value;
 mod schema_compiler;
 mod satya_model_instance;
@@ -394,9 +402,9 @@ impl StreamValidatorCore {
     /// Validate a single JSON object provided as bytes or str.
     /// Returns true if valid, false if invalid (errors are not raised, matching validate_batch behavior).
     fn validate_json_bytes(&self, py: Python<'_>, data: Bound<'_, PyAny>) -> PyResult<bool> {
-        let bytes = extract_bytes(data)?;
-        // Parse once, outside the GIL if possible
-        let parsed = py.detach(|| serde_json::from_slice::<JsonValue>(&bytes));
+        let bytes = json_parse::borrow_bytes(&data)?;
+        // Parse once, outside the GIL (simd-json when built with the feature)
+        let parsed = py.detach(|| json_parse::parse_slice(bytes));
         match parsed {
             Ok(JsonValue::Object(map)) => {
                 // Reuse parsed value, avoid reparsing
@@ -415,9 +423,9 @@ impl StreamValidatorCore {
     /// Validate a JSON array of objects provided as bytes or str.
     /// Returns a vector of booleans corresponding to each element.
     fn validate_json_array_bytes(&self, py: Python<'_>, data: Bound<'_, PyAny>) -> PyResult<Vec<bool>> {
-        let bytes = extract_bytes(data)?;
-        // Parse outside the GIL
-        let parsed = py.detach(|| serde_json::from_slice::<JsonValue>(&bytes));
+        let bytes = json_parse::borrow_bytes(&data)?;
+        // Parse outside the GIL (simd-json when built with the feature)
+        let parsed = py.detach(|| json_parse::parse_slice(bytes));
         match parsed {
             Ok(JsonValue::Array(arr)) => {
                 let mut results = Vec::with_capacity(arr.len());
@@ -499,38 +507,40 @@ impl StreamValidatorCore {
     }
 
     /// STREAMING: Validate NDJSON (each line an object)
+    ///
+    /// Lines are split on raw bytes and each one is validated straight from
+    /// the serde_json token stream: no Python objects and no intermediate
+    /// `Value` are built, and the input buffer is borrowed rather than copied.
     fn validate_ndjson_bytes_streaming(&self, py: Python<'_>, data: Bound<'_, PyAny>) -> PyResult<Vec<bool>> {
-        let bytes = extract_bytes(data)?;
-        let out: Vec<bool> = {
-            let s = std::str::from_utf8(&bytes).map_err(|_| PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid UTF-8"))?;
-            // Parse each line without the GIL
-            py.detach(|| {
-                let mut v = Vec::new();
-                for line in s.lines() {
-                    let line = line.trim();
-                    if line.is_empty() { continue; }
-                    let mut de = serde_json::Deserializer::from_str(line);
-                    match validate_object_streaming(&mut de, &self.schema, self) {
-                        Ok(()) => v.push(true),
-                        Err(StreamErr::WrongTopLevel) => v.push(false),
-                        Err(_) => v.push(false),
-                    }
-                }
-                v
-            })
-        };
+        let bytes = json_parse::borrow_bytes(&data)?;
+        // Parse each line without the GIL
+        let out = py.detach(|| {
+            let mut v = Vec::new();
+            for line in bytes.split(|&b| b == b'\n') {
+                let line = json_parse::trim_ascii(line);
+                if line.is_empty() { continue; }
+                let mut de = serde_json::Deserializer::from_slice(line);
+                v.push(validate_object_streaming(&mut de, &self.schema, self).is_ok());
+            }
+            v
+        });
         Ok(out)
     }
 
     /// Validate NDJSON (one JSON object per line) provided as bytes or str.
     /// Returns a vector of booleans corresponding to each line/object.
     fn validate_ndjson_bytes(&self, py: Python<'_>, data: Bound<'_, PyAny>) -> PyResult<Vec<bool>> {
-        let bytes = extract_bytes(data)?;
-        let s = std::str::from_utf8(&bytes).map_err(|_| PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid UTF-8"))?;
+        let bytes = json_parse::borrow_bytes(&data)?;
         // Parse lines outside the GIL; then convert objects to Py for validation
-        let parsed: Vec<Result<JsonValue, serde_json::Error>> = py.detach(|| {
-            s.lines()
-                .map(|line| serde_json::from_str::<JsonValue>(line.trim()))
+        let parsed: Vec<Result<JsonValue, String>> = py.detach(|| {
+            if bytes.is_empty() {
+                return Vec::new();
+            }
+            // Same line boundaries as str::lines(): a final newline does not
+            // start another (empty) line
+            let body = bytes.strip_suffix(b"\n").unwrap_or(bytes);
+            body.split(|&b| b == b'\n')
+                .map(|line| json_parse::parse_slice(json_parse::trim_ascii(line)))
                 .collect()
         });
         let mut results = Vec::with_capacity(parsed.len());
@@ -1043,5 +1053,18 @@ fn _satya(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(validate_batch_native, m)?)?;
     m.add_function(wrap_pyfunction!(validate_batch_parallel, m)?)?;
     
+    // Direct Python -> JSON bytes serialization
+    m.add_function(wrap_pyfunction!(dump_json, m)?)?;
+    m.add_function(wrap_pyfunction!(dump_json_into, m)?)?;
+    m.add_function(wrap_pyfunction!(dump_json_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(dump_json_many, m)?)?;
+    m.add_function(wrap_pyfunction!(dump_json_all_into, m)?)?;
+    
+    // JSON bytes -> Python objects (optional simd-json backend)
+    m.add_function(wrap_pyfunction!(load_json_bytes, m)?)?;
+    m.add_function(wrap_pyfunction!(load_json_multi, m)?)?;
+    m.add_function(wrap_pyfunction!(load_json_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(simd_json_enabled, m)?)?;
+    
     Ok(())
 }
\ No newline at end of file
@@ -5,6 +5,7 @@ use pyo3::prelude::*;
 use pyo3::types::{PyDict, PyString, PyList};
 use std::collections::HashMap;
 use regex::Regex;
+use crate::pattern::FastPattern;
 use once_cell::sync::Lazy;
 use rayon::prelude::*;
 
@@ -61,7 +62,7 @@ pub struct NativeFieldSpec {
     pub le: Option<f64>,
     pub min_length: Option<usize>,
     pub max_length: Option<usize>,
-    pub pattern: Option<Regex>,
+    pub pattern: Option<FastPattern>,
     pub email: bool,
     pub url: bool,
     pub enum_values: Option<Vec<String>>,
@@ -122,7 +123,7 @@ impl NativeModelValidator {
             field.le = le;
             field.min_length = min_length;
             field.max_length = max_length;
-            field.pattern = pattern.and_then(|p| Regex::new(&p).ok());
+            field.pattern = pattern.and_then(|p| FastPattern::new(&p).ok());
             field.email = email;
             field.url = url;
             field.enum_values = enum_values;
@@ -0,0 +1,368 @@
+/// Fast-path matchers for common `Field(pattern=...)` shapes
+///
+/// Most patterns seen in real schemas are either a single character class
+/// over the whole string (`^[A-Za-z\s]+$`, `^[a-z0-9_]{3,20}$`) or fixed-width
+/// digit groups (`^\d{5}(-\d{4})?$`), or fixed-width runs joined by literal
+/// separators (UUIDs, dates, phone numbers). All are recognised once, when the
+/// constraint is set, and matched with a byte-table scan instead of running
+/// the regex engine. Anything else falls back to the compiled `Regex`.
+///
+/// The fast paths only decide ASCII input. A string containing non-ASCII
+/// bytes is always handed to the regex, so Unicode semantics of `\d`, `\s`
+/// and `\w` are preserved exactly.
+
+use regex::Regex;
+
+/// Byte classes in a `ByteTable`
+const MEMBER: u8 = 0;
+const NON_MEMBER: u8 = 1;
+const NON_ASCII: u8 = 2;
+
+/// 256-entry lookup table: one load per input byte, no branches in the scan
+#[derive(Clone)]
+struct ByteTable([u8; 256]);
+
+impl ByteTable {
+    fn empty() -> Self {
+        let mut table = [NON_MEMBER; 256];
+        for b in 0x80..=0xFF {
+            table[b] = NON_ASCII;
+        }
+        ByteTable(table)
+    }
+
+    fn add(&mut self, b: u8) {
+        self.0[b as usize] = MEMBER;
+    }
+
+    fn add_range(&mut self, lo: u8, hi: u8) {
+        for b in lo..=hi {
+            self.add(b);
+        }
+    }
+
+    /// OR of the classes of every byte in `bytes`
+    #[inline(always)]
+    fn scan(&self, bytes: &[u8]) -> u8 {
+        bytes.iter().fold(0u8, |acc, &b| acc | self.0[b as usize])
+    }
+}
+
+#[derive(Clone)]
+enum Shape {
+    /// `^[class]{min,max}$` (covers `+`, `*` and `{n}` quantifiers)
+    Class { table: ByteTable, min: usize, max: usize },
+    /// `^\d{head}$` or `^\d{head}(SEP\d{tail})?$`
+    DigitGroups { head: usize, tail: Option<(u8, usize)> },
+    /// Fixed-length layout such as `^[0-9a-f]{8}-[0-9a-f]{4}-...{12}$`:
+    /// class runs at known offsets with literal bytes between them
+    Fixed { len: usize, runs: Vec<(ByteTable, usize, usize)>, literals: Vec<(usize, u8)> },
+    /// No fast path: always use the regex
+    Generic,
+}
+
+/// A compiled pattern with an optional specialised matcher
+#[derive(Clone)]
+pub struct FastPattern {
+    shape: Shape,
+    regex: Regex,
+}
+
+impl FastPattern {
+    pub fn new(pattern: &str) -> Result<Self, regex::Error> {
+        let regex = Regex::new(pattern)?;
+        let shape = parse_class_shape(pattern)
+            .or_else(|| parse_digit_groups(pattern))
+            .or_else(|| parse_fixed_layout(pattern))
+            .unwrap_or(Shape::Generic);
+        Ok(FastPattern { shape, regex })
+    }
+
+    #[inline]
+    pub fn is_match(&self, s: &str) -> bool {
+        let fast = match &self.shape {
+            Shape::Class { table, min, max } => match_class(table, *min, *max, s),
+            Shape::DigitGroups { head, tail } => match_digit_groups(*head, *tail, s),
+            Shape::Fixed { len, runs, literals } => match_fixed(*len, runs, literals, s),
+            Shape::Generic => None,
+        };
+        match fast {
+            Some(matched) => matched,
+            None => self.regex.is_match(s),
+        }
+    }
+}
+
+#[inline]
+fn match_class(table: &ByteTable, min: usize, max: usize, s: &str) -> Option<bool> {
+    let classes = table.scan(s.as_bytes());
+    if classes & NON_MEMBER != 0 {
+        // An ASCII byte outside the class can never match
+        return Some(false);
+    }
+    if classes & NON_ASCII != 0 {
+        return None;
+    }
+    // All ASCII: byte length == char length
+    let len = s.len();
+    Some(len >= min && len <= max)
+}
+
+#[inline(always)]
+fn all_digits(bytes: &[u8]) -> bool {
+    bytes.iter().fold(true, |acc, b| acc & b.is_ascii_digit())
+}
+
+#[inline]
+fn match_digit_groups(head: usize, tail: Option<(u8, usize)>, s: &str) -> Option<bool> {
+    let bytes = s.as_bytes();
+    if !s.is_ascii() {
+        // Non-ASCII digits (e.g. Arabic-Indic) match Unicode \d
+        return None;
+    }
+    if bytes.len() == head {
+        return Some(all_digits(bytes));
+    }
+    match tail {
+        Some((sep, n)) if bytes.len() == head + 1 + n => Some(
+            all_digits(&bytes[..head]) & (bytes[head] == sep) & all_digits(&bytes[head + 1..]),
+        ),
+        _ => Some(false),
+    }
+}
+
+#[inline]
+fn match_fixed(len: usize, runs: &[(ByteTable, usize, usize)], literals: &[(usize, u8)], s: &str) -> Option<bool> {
+    let bytes = s.as_bytes();
+    if !s.is_ascii() {
+        // Classes may contain \d / \w / \s, which match non-ASCII chars
+        return None;
+    }
+    if bytes.len() != len {
+        return Some(false);
+    }
+    // Offsets are fixed, so every check is an indexed load: no backtracking
+    // and no data-dependent branches until the final combine
+    let literals_ok = literals.iter().fold(true, |acc, &(i, b)| acc & (bytes[i] == b));
+    let classes = runs
+        .iter()
+        .fold(0u8, |acc, (table, start, end)| acc | table.scan(&bytes[*start..*end]));
+    Some(literals_ok & (classes == MEMBER))
+}
+
+/// Parse `{n}`, `{n,}`, `{n,m}`, `+` or `*` at the start of `s`.
+/// Returns (min, max, rest).
+fn parse_quantifier(s: &str) -> Option<(usize, usize, &str)> {
+    if let Some(rest) = s.strip_prefix('+') {
+        return Some((1, usize::MAX, rest));
+    }
+    if let Some(rest) = s.strip_prefix('*') {
+        return Some((0, usize::MAX, rest));
+    }
+    let inner = s.strip_prefix('{')?;
+    let close = inner.find('}')?;
+    let (body, rest) = (&inner[..close], &inner[close + 1..]);
+    let (min, max) = match body.split_once(',') {
+        None => {
+            let n = body.parse().ok()?;
+            (n, n)
+        }
+        Some((lo, "")) => (lo.parse().ok()?, usize::MAX),
+        Some((lo, hi)) => (lo.parse().ok()?, hi.parse().ok()?),
+    };
+    if min > max {
+        return None;
+    }
+    Some((min, max, rest))
+}
+
+/// Parse a character class body (after the opening `[`) up to and including
+/// the closing `]`. Returns the table and the rest of the pattern.
+fn parse_class(body: &str) -> Option<(ByteTable, &str)> {
+    // Negation and set operations are left to the regex engine
+    if body.starts_with('^') {
+        return None;
+    }
+
+    let mut table = ByteTable::empty();
+    let bytes = body.as_bytes();
+    let mut i = 0;
+    let mut any = false;
+    loop {
+        let b = *bytes.get(i)?;
+        if b == b']' && any {
+            i += 1;
+            break;
+        }
+        if b >= 0x80 || b == b'[' {
+            return None;
+        }
+        if b == b'\\' {
+            let e = *bytes.get(i + 1)?;
+            match e {
+                b's' => {
+                    // ASCII members of Unicode White_Space
+                    table.add_range(b'\t', b'\r');
+                    table.add(b' ');
+                }
+                b'd' => table.add_range(b'0', b'9'),
+                b'w' => {
+                    table.add_range(b'a', b'z');
+                    table.add_range(b'A', b'Z');
+                    table.add_range(b'0', b'9');
+                    table.add(b'_');
+                }
+                _ if e.is_ascii_punctuation() => table.add(e),
+                _ => return None,
+            }
+            // An escaped range start (`[\.-z]`) is a range to the regex
+            // engine, not three literals
+            if bytes.get(i + 2) == Some(&b'-') && bytes.get(i + 3).map_or(false, |&c| c != b']') {
+                return None;
+            }
+            i += 2;
+        } else if (b == b'&' || b == b'-' || b == b'~') && bytes.get(i + 1) == Some(&b) {
+            // `&&`, `--`, `~~` set operations
+            return None;
+        } else if bytes.get(i + 1) == Some(&b'-') && bytes.get(i + 2).map_or(false, |&c| c != b']') {
+            let hi = bytes[i + 2];
+            if hi >= 0x80 || hi == b'\\' || hi == b'[' || hi < b {
+                return None;
+            }
+            table.add_range(b, hi);
+            i += 3;
+        } else {
+            table.add(b);
+            i += 1;
+        }
+        any = true;
+    }
+    Some((table, &body[i..]))
+}
+
+/// Recognise `^[...]<quantifier>$`
+fn parse_class_shape(pattern: &str) -> Option<Shape> {
+    let body = pattern.strip_prefix("^[")?;
+    let (table, rest) = parse_class(body)?;
+    let (min, max, rest) = parse_quantifier(rest)?;
+    if rest != "$" {
+        return None;
+    }
+    Some(Shape::Class { table, min, max })
+}
+
+/// Recognise `^` (CLASS{n} | LITERAL)+ `$` where CLASS is `[...]`, `\d` or
+/// `\w` and every quantifier is an exact count
+fn parse_fixed_layout(pattern: &str) -> Option<Shape> {
+    let mut rest = pattern.strip_prefix('^')?;
+    let mut runs = Vec::new();
+    let mut literals = Vec::new();
+    let mut len = 0usize;
+
+    while rest != "$" {
+        let (table, after) = if let Some(body) = rest.strip_prefix('[') {
+            parse_class(body)?
+        } else if let Some(after) = rest.strip_prefix("\\d") {
+            let mut t = ByteTable::empty();
+            t.add_range(b'0', b'9');
+            (t, after)
+        } else if let Some(after) = rest.strip_prefix("\\w") {
+            let mut t = ByteTable::empty();
+            t.add_range(b'a', b'z');
+            t.add_range(b'A', b'Z');
+            t.add_range(b'0', b'9');
+            t.add(b'_');
+            (t, after)
+        } else {
+            // A single literal byte, escaped or not
+            let (b, after) = match rest.as_bytes() {
+                [b'\\', c, ..] if c.is_ascii_punctuation() => (*c, &rest[2..]),
+                [c, ..] if c.is_ascii_alphanumeric() || matches!(c, b'-' | b'_' | b' ' | b'/' | b':' | b'@' | b',') => {
+                    (*c, &rest[1..])
+                }
+                _ => return None,
+            };
+            literals.push((len, b));
+            len += 1;
+            rest = after;
+            continue;
+        };
+        // A class without a quantifier matches exactly one byte
+        let (n, after) = match parse_quantifier(after) {
+            Some((min, max, after)) if min == max => (min, after),
+            Some(_) => return None,
+            None => (1, after),
+        };
+        runs.push((table, len, len + n));
+        len += n;
+        rest = after;
+    }
+
+    // Worth it only when there is structure to exploit; single runs are
+    // already covered by the Class shape
+    if runs.len() < 2 {
+        return None;
+    }
+    Some(Shape::Fixed { len, runs, literals })
+}
+
+/// Parse a single digit atom (`\d` or `[0-9]`) followed by `{n}`
+fn parse_digit_run(s: &str) -> Option<(usize, &str)> {
+    let rest = s.strip_prefix("\\d").or_else(|| s.strip_prefix("[0-9]"))?;
+    let (min, max, rest) = parse_quantifier(rest)?;
+    if min != max {
+        return None;
+    }
+    Some((min, rest))
+}
+
+/// Recognise `^\d{n}$` and `^\d{n}(SEP\d{m})?$` (also with `(?:`)
+fn parse_digit_groups(pattern: &str) -> Option<Shape> {
+    let s = pattern.strip_prefix('^')?;
+    let (head, rest) = parse_digit_run(s)?;
+    if rest == "$" {
+        return Some(Shape::DigitGroups { head, tail: None });
+    }
+
+    let group = rest.strip_prefix("(?:").or_else(|| rest.strip_prefix('('))?;
+    let (sep, group) = match group.as_bytes() {
+        [b'\\', c, ..] if c.is_ascii_punctuation() => (*c, &group[2..]),
+        [c, ..] if matches!(c, b'-' | b'_' | b' ' | b'/' | b':') => (*c, &group[1..]),
+        _ => return None,
+    };
+    let (tail, rest) = parse_digit_run(group)?;
+    if rest != ")?$" {
+        return None;
+    }
+    Some(Shape::DigitGroups { head, tail: Some((sep, tail)) })
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    /// The fast paths must agree with the regex engine on every input
+    fn assert_agrees(pattern: &str, inputs: &[&str]) {
+        let fast = FastPattern::new(pattern).unwrap();
+        let regex = Regex::new(pattern).unwrap();
+        for s in inputs {
+            assert_eq!(fast.is_match(s), regex.is_match(s), "{:?} against {:?}", s, pattern);
+        }
+    }
+
+    #[test]
+    fn escaped_range_start_matches_regex() {
+        let inputs = ["A", "z", ".", "-", "/", "a.b", "", " ", "~"];
+        assert_agrees(r"^[\.-z]+$", &inputs);
+        assert_agrees(r"^[\--/]+$", &inputs);
+        // A trailing `-` after an escape is still a literal
+        assert_agrees(r"^[\.-]+$", &inputs);
+    }
+
+    #[test]
+    fn common_shapes_match_regex() {
+        assert_agrees(r"^[A-Za-z\s]+$", &["New York", "New York 2", "", "\t"]);
+        assert_agrees(r"^[a-z0-9_]{3,20}$", &["abc", "ab", "a_1", "ABC", "abcdefghijklmnopqrstu"]);
+        assert_agrees(r"^\d{5}(-\d{4})?$", &["10001", "02134-1234", "02134-123", "1000"]);
+    }
+}
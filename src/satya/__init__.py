@@ -326,6 +326,9 @@ class ModelMetaclass(type):
         # PYDANTIC-STYLE: Cache validator core at class level (no method call overhead!)
         # This will be set lazily on first use
         namespace['__satya_validator_core__'] = None
+        # Per-class validator cache: without its own slot a subclass would read
+        # (and reuse) the validator already built for its parent's schema
+        namespace['_validator_instance'] = None
         
         return super().__new__(mcs, name, bases, namespace)
 
@@ -524,7 +527,10 @@ class Model(metaclass=ModelMetaclass):
         
     @classmethod
     def validator(cls) -> 'StreamValidator':
-        """Create a validator for this model - BLAZE OPTIMIZED!"""
+        """Create a validator for this model - BLAZE OPTIMIZED!
+
+        Built once per class and cached; repeated calls are a single attribute read.
+        """
         if cls._validator_instance is None:
             try:
                 from ._satya import BlazeValidatorPy
@@ -747,6 +753,11 @@ class Model(metaclass=ModelMetaclass):
                 return [_dump_val(x) for x in v]
             return v
         
+        # Fast path: no filtering or renaming requested, so skip the
+        # per-key option checks and build the dict in one comprehension
+        if not (include or exclude or by_alias or exclude_unset or exclude_defaults or exclude_none):
+            return {k: _dump_val(v) for k, v in self._data.items()}
+        
         # Start with all data
         d = {}
         for k, v in self._data.items():
@@ -792,6 +803,25 @@ class Model(metaclass=ModelMetaclass):
                               by_alias=by_alias, exclude_unset=exclude_unset,
                               exclude_defaults=exclude_defaults, exclude_none=exclude_none)
         return json.dumps(data, indent=indent)
+
+    def json_bytes(self) -> bytes:
+        """Serialize the model to compact JSON bytes.
+
+        Encodes straight from the validated data in Rust: no intermediate
+        dict from ``model_dump`` and no ``str`` decode/encode round-trip.
+        """
+        from ._satya import dump_json
+        return dump_json(self._data)
+
+    @classmethod
+    def json_from_dict(cls, data: Dict[str, Any]) -> bytes:
+        """Validate a dict and serialize it to JSON bytes without building an instance.
+
+        Skips ``__init__`` and attribute setup: validation and serialization
+        both run against the cached validator. Raises ModelValidationError if
+        the data is invalid.
+        """
+        return cls.validator().to_json(data)
     
     def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'Model':
         """Create a copy of the model, optionally updating fields."""
@@ -0,0 +1,177 @@
+"""
+FastAPI integration for Satya
+
+Helpers for using Satya models in FastAPI (and Starlette) applications:
+
+- SatyaJSONResponse: a response class that serializes Satya models, including
+  models nested inside dicts and lists, without converting them by hand.
+- validate_request_model: validate a request payload against a Satya model and
+  turn validation failures into HTTP 422 responses
+  (SatyaValidationHTTPException).
+- validate_request_data: the same validation, returning the model's
+  model_dump() dict.
+
+Example:
+    from fastapi import FastAPI, Body
+    from satya.fastapi import SatyaJSONResponse, validate_request_model
+
+    app = FastAPI()
+
+    @app.post("/items", response_class=SatyaJSONResponse)
+    def create_item(payload: dict = Body(...)):
+        return validate_request_model(Item, payload)
+"""
+import json
+from datetime import date, time
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Type, TypeVar
+from uuid import UUID
+
+try:
+    from fastapi import HTTPException
+    from fastapi.responses import JSONResponse
+except ImportError as e:  # pragma: no cover - depends on the environment
+    raise ImportError(
+        "satya.fastapi requires FastAPI. Install with: pip install fastapi"
+    ) from e
+
+# orjson is optional; render() falls back to the stdlib encoder without it
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    orjson = None  # Make it mockable
+    _HAVE_ORJSON = False
+
+from . import Model, ModelValidationError, ValidationError
+
+M = TypeVar("M", bound=Model)
+
+
+# Encoder for each supported type seen by _default, resolved once per type.
+# Unsupported types are never added, so the table stays bounded by the
+# Model classes and the handful of value types below.
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {}
+
+
+def _encoder_for(tp: type) -> Optional[Callable[[Any], Any]]:
+    if issubclass(tp, Model):
+        return tp.model_dump
+    if issubclass(tp, (date, time)):  # datetime is a date subclass
+        return tp.isoformat
+    if issubclass(tp, (Decimal, UUID)):
+        return str
+    return None
+
+
+def _default(value: Any) -> Any:
+    """Fallback for values the JSON encoder does not know.
+
+    Models are dumped here, as the encoder reaches them, so nested models are
+    converted during the single serialization pass instead of in a separate
+    walk over the content beforehand. The content itself is never modified.
+
+    Like JSONResponse, any other type raises TypeError rather than being
+    rendered as its str().
+    """
+    tp = type(value)
+    encode = _ENCODERS.get(tp)
+    if encode is None:
+        encode = _encoder_for(tp)
+        if encode is None:
+            raise TypeError(f"Object of type {tp.__name__} is not JSON serializable")
+        _ENCODERS[tp] = encode
+    return encode(value)
+
+
+class SatyaJSONResponse(JSONResponse):
+    """JSON response that understands Satya models.
+
+    Content may be a Model, or any dict/list structure containing Models.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if _HAVE_ORJSON:
+            return orjson.dumps(
+                content,
+                default=_default,
+                # No OPT_NAIVE_UTC: naive datetimes stay naive, as in the
+                # stdlib fallback's isoformat()
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=_default,
+        ).encode("utf-8")
+
+
+def _error_detail(errors: List[ValidationError]) -> List[Dict[str, Any]]:
+    """FastAPI-style 422 detail entries for Satya validation errors."""
+    return [
+        {
+            "loc": ["body", *(err.path or (err.field,))],
+            "msg": err.message,
+            "type": "validation_error",
+        }
+        for err in errors
+    ]
+
+
+class SatyaValidationHTTPException(HTTPException):
+    """422 response for a payload that failed Satya validation.
+
+    ``detail`` is the FastAPI-style list of error entries, built once here;
+    FastAPI wraps it as ``{"detail": [...]}`` itself. The original errors
+    are kept on ``errors``.
+    """
+
+    def __init__(self, errors: List[ValidationError]):
+        super().__init__(status_code=422, detail=_error_detail(errors))
+        self.errors = errors
+
+
+def _require_object(data: Any) -> None:
+    if not isinstance(data, dict):
+        raise HTTPException(
+            status_code=422,
+            detail=[{"loc": ["body"], "msg": "Request body must be a JSON object", "type": "type_error"}],
+        )
+
+
+def validate_request_data(model_class: Type[Model], data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate a request payload against a model and return it as a dict.
+
+    Goes through validate_request_model and returns ``model_dump()``, so
+    defaults, optional fields, coercion and nested models come out exactly
+    as they do on the model instance. Use it when the handler only needs
+    the data, for example to serialize it straight back out.
+
+    Raises:
+        HTTPException: status 422 if the payload is not a JSON object.
+        SatyaValidationHTTPException: status 422 with FastAPI-style error
+            details if the payload does not validate.
+    """
+    return validate_request_model(model_class, data).model_dump()
+
+
+def validate_request_model(model_class: Type[M], data: Dict[str, Any]) -> M:
+    """Validate a request payload and return a model instance.
+
+    The model's validator is compiled once per class (``Model.validator()``
+    caches it), so repeated requests only pay for validation itself.
+
+    Raises:
+        HTTPException: status 422 if the payload is not a JSON object.
+        SatyaValidationHTTPException: status 422 with FastAPI-style error
+            details if the payload does not validate.
+    """
+    _require_object(data)
+    try:
+        return model_class(**data)
+    except ModelValidationError as e:
+        raise SatyaValidationHTTPException(e.errors)
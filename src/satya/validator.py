@@ -1,13 +1,24 @@
-from typing import Any, Dict, Iterable, Iterator, Optional, List, get_args, get_origin, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple, get_args, get_origin, Union
 from datetime import datetime
 from decimal import Decimal
 import json
 import re
-from ._satya import StreamValidatorCore
-from . import ValidationError, ValidationResult
+import threading
+from ._satya import (
+    StreamValidatorCore, dump_json, dump_json_all_into, dump_json_batch, dump_json_into, dump_json_many,
+    load_json_batch, load_json_bytes, load_json_multi,
+)
+from . import ValidationError, ValidationResult, ModelValidationError
 from .json_loader import load_json
 
+# Patterns for the Python-side email/url checks, compiled once at import
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^https?://[A-Za-z0-9.-]+(?::\d+)?(?:/[^\s]*)?$")
+
 class StreamValidator:
+    # Upper bound on validate_cached() entries; oldest entries are evicted first
+    VALIDITY_CACHE_SIZE = 4096
+
     def __init__(self):
         self._core = StreamValidatorCore()
         # Compatibility alias expected by some benchmarks (validator._validator)
@@ -18,6 +29,10 @@ class StreamValidator:
         self._root_types: Dict[str, Any] = {}
         # Store constraints at Python level to supplement/override core behavior
         self._constraints: Dict[str, Dict[str, Any]] = {}
+        # validate_cached(): raw JSON payload -> is_valid, reset on schema changes
+        self._validity_cache: Dict[Union[str, bytes], bool] = {}
+        # Serializes validate_cached() eviction + insert across threads
+        self._validity_lock = threading.Lock()
 
     # --- Helpers ---
     def _type_to_str(self, tp: Any) -> str:
@@ -83,6 +98,7 @@ class StreamValidator:
         field_str = field_type if isinstance(field_type, str) else self._type_to_str(field_type)
         # Save python type for coercions if possible
         self._root_types[name] = field_type
+        self._validity_cache.clear()
         return self._core.add_field(name, field_str, required)
 
     def set_constraints(
@@ -113,6 +129,8 @@ class StreamValidator:
             "min_value": min_value,
             "max_value": max_value,
             "pattern": pattern,
+            # Compiled here, once per field, rather than on every validate()
+            "pattern_re": re.compile(pattern) if pattern else None,
             "email": email,
             "url": url,
             "ge": ge,
@@ -134,6 +152,7 @@ class StreamValidator:
         core_gt = int(gt) if gt is not None and isinstance(gt, (int, float)) and gt == int(gt) else None
         core_lt = int(lt) if lt is not None and isinstance(lt, (int, float)) and lt == int(lt) else None
         
+        self._validity_cache.clear()
         return self._core.set_field_constraints(
             field_name,
             min_length,
@@ -162,6 +181,7 @@ class StreamValidator:
         """Add a field to a custom type. Accepts Python/typing types or core type strings."""
         field_str = field_type if isinstance(field_type, str) else self._type_to_str(field_type)
         self._type_registry.setdefault(type_name, {})[field_name] = field_str
+        self._validity_cache.clear()
         return self._core.add_field_to_custom_type(type_name, field_name, field_str, required)
 
     # Compatibility with older registration helper
@@ -227,21 +247,16 @@ class StreamValidator:
                         py_errors.append(ValidationError(field=fname, message=f"String shorter than min_length={cons['min_length']}", path=[fname]))
                     if cons.get("max_length") is not None and len(v) > int(cons["max_length"]):
                         py_errors.append(ValidationError(field=fname, message=f"String longer than max_length={cons['max_length']}", path=[fname]))
-                    pat = cons.get("pattern")
-                    if pat:
-                        import re as _re
-                        if _re.match(pat, v) is None:
-                            py_errors.append(ValidationError(field=fname, message=f"String does not match pattern: {pat}", path=[fname]))
+                    pat_re = cons.get("pattern_re")
+                    if pat_re is not None and pat_re.match(v) is None:
+                        py_errors.append(ValidationError(field=fname, message=f"String does not match pattern: {cons['pattern']}", path=[fname]))
                     # Email
                     if cons.get("email"):
-                        import re as _re
-                        email_pat = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                        if _re.match(email_pat, v) is None:
+                        if _EMAIL_RE.match(v) is None:
                             py_errors.append(ValidationError(field=fname, message="Invalid email format", path=[fname]))
                     # URL (simple http/https)
                     if cons.get("url"):
-                        import re as _re
-                        if _re.match(r"^https?://[A-Za-z0-9.-]+(?::\d+)?(?:/[^\s]*)?$", v) is None:
+                        if _URL_RE.match(v) is None:
                             py_errors.append(ValidationError(field=fname, message="Invalid URL format", path=[fname]))
 
                 # Integers and Floats: ge/le/gt/lt
@@ -464,6 +479,13 @@ class StreamValidator:
         If streaming=True, uses serde_json streaming validation to avoid building intermediate values.
         """
         mode = mode.lower()
+        if mode == "ndjson":
+            # Lines are checked independently in Rust; decoding the whole
+            # blob here would only add a full copy of the payload
+            return (
+                self._core.validate_ndjson_bytes_streaming(data)
+                if streaming else self._core.validate_ndjson_bytes(data)
+            )
         # Early sanity checks for top-level type and malformed JSON to match tests' expectations
         if isinstance(data, (bytes, bytearray)):
             text = data.decode("utf-8", errors="ignore")
@@ -496,9 +518,6 @@ class StreamValidator:
                     obj = json.loads(text)
                 except Exception as e:
                     raise e
-        elif mode == "ndjson":
-            # Allow empty
-            pass
         else:
             raise ValueError(f"Unknown mode: {mode}")
         if mode == "object":
@@ -511,11 +530,6 @@ class StreamValidator:
                 self._core.validate_json_array_bytes_streaming(data)
                 if streaming else self._core.validate_json_array_bytes(data)
             )
-        if mode == "ndjson":
-            return (
-                self._core.validate_ndjson_bytes_streaming(data)
-                if streaming else self._core.validate_ndjson_bytes(data)
-            )
         raise ValueError(f"Unknown mode: {mode}")
 
     # --- Convenience APIs returning ValidationResult ---
@@ -575,6 +589,215 @@ class StreamValidator:
         """Validate a batch of items and return a list of ValidationResult (non-breaking addition)."""
         return [self.validate(it) for it in items]
 
+    # --- JSON Serialization API ---
+    def to_json(self, item: dict) -> bytes:
+        """Validate an item and serialize it to JSON bytes in one call.
+
+        Serialization runs in Rust directly from the Python objects, with no
+        intermediate ``str``. Raises ModelValidationError if the item is invalid.
+
+        Example:
+            >>> validator.to_json({"name": "test"})
+            b'{"name":"test"}'
+        """
+        result = self.validate(item)
+        if not result.is_valid:
+            raise ModelValidationError(result.errors)
+        return dump_json(result.value)
+
+    def try_to_json(self, item: dict) -> ValidationResult:
+        """Like to_json, but reports invalid items instead of raising.
+
+        Returns a ValidationResult whose value is the JSON bytes. Meant for
+        streams with many invalid records, where raising and catching an
+        exception per record costs more than the validation itself.
+
+        Example:
+            >>> result = validator.try_to_json({"name": 1})
+            >>> result.is_valid
+            False
+        """
+        result = self.validate(item)
+        if not result.is_valid:
+            return result
+        return ValidationResult(value=dump_json(result.value))
+
+    def to_json_into(self, item: dict, out: bytearray, offset: int = 0) -> int:
+        """Validate an item and write its JSON encoding into ``out`` at ``offset``.
+
+        ``out`` is grown if needed but never shrunk, so one buffer can be
+        reused across calls without per-call allocations. Returns the end
+        offset; the encoded item is ``out[offset:end]``. Passing the previous
+        end as ``offset`` appends records back to back.
+
+        Example:
+            >>> buf = bytearray(4096)
+            >>> n = validator.to_json_into({"name": "test"}, buf)
+            >>> bytes(buf[:n])
+            b'{"name":"test"}'
+        """
+        result = self.validate(item)
+        if not result.is_valid:
+            raise ModelValidationError(result.errors)
+        return dump_json_into(result.value, out, offset)
+
+    def to_json_all_into(self, items: Iterable[dict], out: bytearray) -> List[int]:
+        """Validate many items and write their encodings back to back into ``out``.
+
+        One Rust call encodes the whole batch and copies it into ``out``
+        (grown at most once). Returns ``len(items) + 1`` offsets: item ``i`` is
+        ``out[offsets[i]:offsets[i + 1]]``. Raises ModelValidationError on the
+        first invalid item, before anything is written.
+        """
+        values = []
+        for item in items:
+            result = self.validate(item)
+            if not result.is_valid:
+                raise ModelValidationError(result.errors)
+            values.append(result.value)
+        return dump_json_all_into(values, out)
+
+    def to_json_batch(self, items: Iterable[dict]) -> List[bytes]:
+        """Validate and serialize many items; returns one bytes object per item.
+
+        All items are validated first, then serialized in a single Rust call
+        instead of one call per item. Raises ModelValidationError on the first
+        invalid item.
+        """
+        values = []
+        for item in items:
+            result = self.validate(item)
+            if not result.is_valid:
+                raise ModelValidationError(result.errors)
+            values.append(result.value)
+        return dump_json_batch(values)
+
+    def to_json_many(self, items: Iterable[dict]) -> Tuple[bytes, List[int]]:
+        """Validate and serialize many items into one contiguous buffer.
+
+        Returns ``(buf, offsets)``: item ``i`` is ``buf[offsets[i]:offsets[i + 1]]``.
+        The schema's field names are encoded once and reused for every item,
+        and only two Python objects are allocated for the whole batch. Raises
+        ModelValidationError on the first invalid item.
+
+        Example:
+            >>> buf, offsets = validator.to_json_many([{"name": "a"}, {"name": "b"}])
+            >>> buf[offsets[1]:offsets[2]]
+            b'{"name":"b"}'
+        """
+        values = []
+        for item in items:
+            result = self.validate(item)
+            if not result.is_valid:
+                raise ModelValidationError(result.errors)
+            values.append(result.value)
+        return dump_json_many(values, list(self._root_types))
+
+    def from_json(self, data: Union[str, bytes]) -> dict:
+        """Parse a JSON object from str or bytes and validate it.
+
+        Parsing happens in Rust (serde_json, or simd-json when the extension
+        is built with the ``simd-json`` feature). Returns the validated dict;
+        raises ValueError for malformed JSON and ModelValidationError if the
+        object is invalid.
+
+        Example:
+            >>> validator.from_json(b'{"name": "test"}')
+            {'name': 'test'}
+        """
+        obj = load_json_bytes(data)
+        if not isinstance(obj, dict):
+            raise ModelValidationError([ValidationError(field="root", message="JSON must be an object", path=["root"])])
+        result = self.validate(obj)
+        if not result.is_valid:
+            raise ModelValidationError(result.errors)
+        return result.value
+
+    def try_from_json(self, data: Union[str, bytes]) -> ValidationResult:
+        """Like from_json, but reports bad documents instead of raising.
+
+        Malformed JSON, non-object documents and invalid objects all come back
+        as an invalid ValidationResult; the value of a valid result is the
+        validated dict.
+        """
+        try:
+            obj = load_json_bytes(data)
+        except ValueError as e:
+            return ValidationResult(errors=[ValidationError(field="root", message=str(e), path=["root"])])
+        if not isinstance(obj, dict):
+            return ValidationResult(errors=[ValidationError(field="root", message="JSON must be an object", path=["root"])])
+        return self.validate(obj)
+
+    def validate_cached(self, data: Union[str, bytes]) -> bool:
+        """Whether a raw JSON payload is a valid object, memoized on the payload.
+
+        Meant for hot paths that see the same request bodies repeatedly.
+        The key is the payload itself (``str`` and ``bytes`` cache their own
+        hash), so a repeat costs one dict lookup instead of parse + validate.
+        At most ``VALIDITY_CACHE_SIZE`` payloads are kept; the cache is
+        cleared whenever fields or constraints change.
+
+        Safe to call from several threads sharing one validator: lookups
+        are plain dict reads, and evicting the oldest entry and inserting
+        the new one happen together under a lock. Parsing and validating a
+        miss happens outside the lock.
+        """
+        if isinstance(data, bytearray):
+            data = bytes(data)
+        cache = self._validity_cache
+        try:
+            return cache[data]
+        except KeyError:
+            pass
+        ok = self.try_from_json(data).is_valid
+        with self._validity_lock:
+            if data not in cache and len(cache) >= self.VALIDITY_CACHE_SIZE:
+                # A concurrent clear() may have emptied it since the check
+                cache.pop(next(iter(cache), None), None)
+            cache[data] = ok
+        return ok
+
+    def from_json_multi(self, buf: bytes, offsets: List[int]) -> List[dict]:
+        """Parse and validate many JSON objects packed into one buffer.
+
+        Document ``i`` is ``buf[offsets[i]:offsets[i + 1]]``, so ``offsets``
+        has one more entry than there are documents. The whole buffer crosses
+        into Rust once and all documents are parsed before validation starts.
+        Raises like from_json on the first malformed or invalid document.
+
+        Example:
+            >>> parts = [b'{"name": "a"}', b'{"name": "b"}']
+            >>> offsets = [0, len(parts[0]), len(parts[0]) + len(parts[1])]
+            >>> validator.from_json_multi(b"".join(parts), offsets)
+            [{'name': 'a'}, {'name': 'b'}]
+        """
+        validated = []
+        for i, obj in enumerate(load_json_multi(buf, offsets)):
+            if not isinstance(obj, dict):
+                raise ModelValidationError([ValidationError(field="root", message="JSON must be an object", path=["root", str(i)])])
+            result = self.validate(obj)
+            if not result.is_valid:
+                raise ModelValidationError(result.errors)
+            validated.append(result.value)
+        return validated
+
+    def from_json_batch(self, docs: Iterable[Union[str, bytes]]) -> List[dict]:
+        """Parse and validate a list of JSON documents (str or bytes).
+
+        All documents are parsed in a single Rust call with the GIL released,
+        then validated. Raises like from_json on the first malformed or
+        invalid document.
+        """
+        validated = []
+        for i, obj in enumerate(load_json_batch(list(docs))):
+            if not isinstance(obj, dict):
+                raise ModelValidationError([ValidationError(field="root", message="JSON must be an object", path=["root", str(i)])])
+            result = self.validate(obj)
+            if not result.is_valid:
+                raise ModelValidationError(result.errors)
+            validated.append(result.value)
+        return validated
+
     # --- Internal helpers ---
     def _coerce_item(self, item: dict) -> dict:
         """Light, best-effort coercion based on declared root field types. Provider-agnostic."""
@@ -672,12 +895,11 @@ class StreamValidator:
             v = item[name]
             # pattern/email/url on strings
             if isinstance(v, str):
-                pat = cons.get("pattern")
-                if pat and re.fullmatch(pat, v) is None:
-                    errors.append(ValidationError(field=name, message=f"String does not match pattern: {pat}", path=[name]))
+                pat_re = cons.get("pattern_re")
+                if pat_re is not None and pat_re.fullmatch(v) is None:
+                    errors.append(ValidationError(field=name, message=f"String does not match pattern: {cons['pattern']}", path=[name]))
                 if cons.get("email"):
-                    email_re = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-                    if re.fullmatch(email_re, v) is None:
+                    if _EMAIL_RE.fullmatch(v) is None:
                         errors.append(ValidationError(field=name, message="invalid email format", path=[name]))
                 if cons.get("url"):
                     if not (v.startswith("http://") or v.startswith("https://")):
@@ -130,18 +130,21 @@ impl SatyaModelInstance {
 
     /// Convert to JSON string
     fn json(&self, py: Python<'_>) -> PyResult<String> {
-        let mut json = String::from("{");
+        let mut json = Vec::with_capacity(256);
+        json.push(b'{');
         
         for (i, (field, value)) in self.schema.fields.iter().zip(self.fields.iter()).enumerate() {
             if i > 0 {
-                json.push(',');
+                json.push(b',');
             }
-            json.push_str(&format!("\"{}\":", field.name));
-            json.push_str(&value.to_json());
+            serde_json::to_writer(&mut json, &field.name)
+                .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+            json.push(b':');
+            value.write_json(&mut json);
         }
         
-        json.push('}');
-        Ok(json)
+        json.push(b'}');
+        Ok(String::from_utf8(json).expect("serde_json only emits UTF-8"))
     }
 
     /// String representation
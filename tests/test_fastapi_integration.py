@@ -0,0 +1,141 @@
+import json
+import os
+import sys
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+from typing import List, Optional
+
+import pytest
+
+# Add src to Python path for proper imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+pytest.importorskip("fastapi")
+
+from fastapi import HTTPException
+
+from satya import Field, Model
+import satya.fastapi
+from satya.fastapi import (
+    SatyaJSONResponse,
+    SatyaValidationHTTPException,
+    validate_request_data,
+    validate_request_model,
+)
+
+
+class Item(Model):
+    id: int = Field(ge=1)
+    name: str = Field(min_length=1)
+    price: float = Field(gt=0)
+    tags: List[str] = Field(default=[])
+
+
+class Order(Model):
+    item: Item
+    note: Optional[str] = None
+
+
+def make_item(**overrides) -> dict:
+    data = {"id": 1, "name": "Widget", "price": 9.99, "tags": ["a"]}
+    data.update(overrides)
+    return data
+
+
+def test_response_renders_nested_models():
+    item = Item(**make_item())
+    body = SatyaJSONResponse({"items": [item], "count": 1}).body
+    assert json.loads(body) == {"items": [make_item()], "count": 1}
+
+
+def test_response_renders_model():
+    assert json.loads(SatyaJSONResponse(Item(**make_item())).body) == make_item()
+
+
+def test_response_leaves_content_untouched():
+    created = date(2024, 1, 2)
+    content = {"items": [Item(**make_item())], "created": created}
+    body = SatyaJSONResponse(content).body
+    assert json.loads(body) == {"items": [make_item()], "created": created.isoformat()}
+    assert isinstance(content["items"][0], Item)
+    assert content["created"] is created
+
+
+def test_response_stdlib_fallback(monkeypatch):
+    item = Item(**make_item())
+    fast = SatyaJSONResponse({"item": item, 1: "one"}).body
+    monkeypatch.setattr(satya.fastapi, "_HAVE_ORJSON", False)
+    slow = SatyaJSONResponse({"item": item, 1: "one"}).body
+    assert json.loads(fast) == json.loads(slow) == {"item": make_item(), "1": "one"}
+
+
+def test_response_datetimes_match_without_orjson(monkeypatch):
+    content = {
+        "naive": datetime(2024, 1, 2, 3, 4, 5, 678901),
+        "aware": datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    }
+    fast = SatyaJSONResponse(content).body
+    monkeypatch.setattr(satya.fastapi, "_HAVE_ORJSON", False)
+    slow = SatyaJSONResponse(content).body
+    expected = {key: value.isoformat() for key, value in content.items()}
+    assert json.loads(fast) == json.loads(slow) == expected
+
+
+def test_response_value_types(monkeypatch):
+    uid = UUID("12345678-1234-5678-1234-567812345678")
+    content = {"price": Decimal("9.99"), "id": uid}
+    expected = {"price": "9.99", "id": str(uid)}
+    assert json.loads(SatyaJSONResponse(content).body) == expected
+    for bad in ({1, 2}, object()):
+        with pytest.raises(TypeError):
+            SatyaJSONResponse({"value": bad})
+
+    monkeypatch.setattr(satya.fastapi, "_HAVE_ORJSON", False)
+    assert json.loads(SatyaJSONResponse(content).body) == expected
+    for bad in ({1, 2}, object()):
+        with pytest.raises(TypeError):
+            SatyaJSONResponse({"value": bad})
+    assert set not in satya.fastapi._ENCODERS
+
+
+def test_validate_request_model():
+    item = validate_request_model(Item, make_item())
+    assert isinstance(item, Item)
+    assert item.name == "Widget"
+
+
+def test_validate_request_model_invalid():
+    with pytest.raises(SatyaValidationHTTPException) as exc:
+        validate_request_model(Item, make_item(price=-1))
+    assert isinstance(exc.value, HTTPException)
+    assert exc.value.status_code == 422
+    assert exc.value.detail[0]["loc"][0] == "body"
+    assert exc.value.detail[0]["type"] == "validation_error"
+    assert len(exc.value.detail) == len(exc.value.errors)
+
+    with pytest.raises(HTTPException):
+        validate_request_model(Item, [make_item()])
+
+
+def test_validate_request_data():
+    data = validate_request_data(Item, make_item())
+    assert isinstance(data, dict)
+    assert data == validate_request_model(Item, make_item()).model_dump()
+
+    # Defaults are filled in, as on the model
+    payload = {"id": 2, "name": "Gadget", "price": 1.5}
+    data = validate_request_data(Item, payload)
+    assert data == validate_request_model(Item, payload).model_dump()
+    assert data["tags"] == []
+
+    # Nested models and a missing optional field
+    order = {"item": make_item()}
+    data = validate_request_data(Order, order)
+    assert data == validate_request_model(Order, order).model_dump()
+    assert data["item"] == make_item()
+    assert data["note"] is None
+
+    with pytest.raises(SatyaValidationHTTPException):
+        validate_request_data(Item, make_item(name=""))
+    with pytest.raises(HTTPException):
+        validate_request_data(Item, "not an object")
@@ -130,6 +130,59 @@ class TestFieldConstraints(unittest.TestCase):
         with self.assertRaises(ModelValidationError):
             TestModel(username="johndoe", phone="+1-555-1234567")  # wrong format
 
+    def test_fast_path_pattern_shapes(self):
+        """Character-class and digit-group patterns take the non-regex fast path"""
+        class TestModel(Model):
+            city: str = Field(pattern=r"^[A-Za-z\s]+$")
+            zip_code: str = Field(pattern=r"^\d{5}(-\d{4})?$")
+
+        self.assertEqual(TestModel(city="New York", zip_code="10001").zip_code, "10001")
+        self.assertEqual(TestModel(city="Boston", zip_code="02134-1234").zip_code, "02134-1234")
+
+        for city, zip_code in [
+            ("New York 2", "10001"),    # digit not in class
+            ("", "10001"),              # '+' requires at least one char
+            ("Boston", "1000"),         # too short
+            ("Boston", "02134-123"),    # short extension
+            ("Boston", "02134_1234"),   # wrong separator
+        ]:
+            with self.assertRaises(ModelValidationError):
+                TestModel(city=city, zip_code=zip_code)
+
+    def test_fixed_layout_pattern(self):
+        """UUID-style layouts of fixed-width runs and separators"""
+        class TestModel(Model):
+            id: str = Field(pattern=r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+        uid = "550e8400-e29b-41d4-a716-446655440000"
+        self.assertEqual(TestModel(id=uid).id, uid)
+        for bad in [
+            uid.upper(),           # class is lowercase hex only
+            uid.replace("-", "_"), # wrong separator
+            uid[:-1],              # too short
+            uid + "0",             # too long
+        ]:
+            with self.assertRaises(ModelValidationError):
+                TestModel(id=bad)
+
+    def test_stream_validator_precompiles_pattern(self):
+        """Python-side pattern checks use a regex compiled by set_constraints"""
+        validator = satya.StreamValidator()
+        validator.add_field("code", str)
+        validator.set_constraints("code", pattern=r"^[A-Z]{3}$")
+        self.assertIsInstance(validator._constraints["code"]["pattern_re"], re.Pattern)
+        self.assertTrue(validator.validate({"code": "ABC"}).is_valid)
+        self.assertFalse(validator.validate({"code": "abc"}).is_valid)
+
+    def test_escaped_range_start_pattern(self):
+        """An escaped range start is a range, as in the regex engine"""
+        class TestModel(Model):
+            code: str = Field(pattern=r"^[\.-z]+$")
+
+        self.assertEqual(TestModel(code="A.z").code, "A.z")  # 'A' is inside '.'-'z'
+        with self.assertRaises(ModelValidationError):
+            TestModel(code="A-")  # '-' (0x2D) is below '.'
+
     def test_email_constraint(self):
         """Test email validation constraint"""
         class TestModel(Model):
@@ -69,6 +69,21 @@ def test_validate_ndjson_bytes():
     assert all(res)
 
 
+def test_validate_ndjson_streaming_lines():
+    v = Person.validator()
+    good = json.dumps(make_batch(1)[0])
+    bad = json.dumps({"name": "x", "age": "old", "email": "x@example.com"})
+    blob = f"{good}\r\n\n{bad}\n{{not json\n{good}\n".encode()
+    assert v.validate_json(blob, mode="ndjson", streaming=True) == [True, False, False, True]
+
+
+def test_validate_ndjson_trailing_newline():
+    v = Person.validator()
+    lines = [json.dumps(x) for x in make_batch(3)]
+    assert v.validate_json(("\n".join(lines) + "\n").encode(), mode="ndjson") == [True, True, True]
+    assert v.validate_json(("\r\n".join(lines)).encode(), mode="ndjson") == [True, True, True]
+
+
 def test_validate_json_requires_correct_top_level():
     v = Person.validator()
     # Array provided to object mode -> error
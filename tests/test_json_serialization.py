@@ -0,0 +1,238 @@
+import json
+import os
+import sys
+
+import pytest
+
+# Add src to Python path for proper imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import satya
+from satya import Field, ModelValidationError
+
+
+class Address(satya.Model):
+    street: str
+    city: str
+
+
+class Person(satya.Model):
+    name: str = Field(min_length=2)
+    age: int = Field(ge=0)
+    score: float
+    is_active: bool
+    address: Address
+
+
+def make_person(**overrides) -> dict:
+    data = {
+        "name": "John Doe",
+        "age": 30,
+        "score": 91.5,
+        "is_active": True,
+        "address": {"street": "1 Main St", "city": "Boston"},
+    }
+    data.update(overrides)
+    return data
+
+
+def test_to_json_roundtrip():
+    v = Person.validator()
+    data = make_person()
+    out = v.to_json(data)
+    assert isinstance(out, bytes)
+    assert json.loads(out) == data
+
+
+def test_to_json_escapes_strings():
+    v = Person.validator()
+    data = make_person(name='Jo "Quote" \\ \né')
+    assert json.loads(v.to_json(data))["name"] == data["name"]
+
+
+def test_to_json_invalid_raises():
+    v = Person.validator()
+    with pytest.raises(ModelValidationError):
+        v.to_json(make_person(age=-1))
+
+
+def test_dump_json_non_str_keys():
+    from satya._satya import dump_json
+
+    data = {None: 1, True: 2, False: 3, 4: 5, 1.5: 6, "s": 7}
+    assert dump_json(data) == json.dumps(data, separators=(",", ":")).encode()
+    with pytest.raises(TypeError):
+        dump_json({(1, 2): "tuple key"})
+
+
+def test_to_json_into_reuses_buffer():
+    v = Person.validator()
+    buf = bytearray(8)  # too small: must grow
+    n = v.to_json_into(make_person(), buf)
+    assert json.loads(bytes(buf[:n])) == make_person()
+
+    # A shorter record reuses the same buffer without shrinking it
+    size = len(buf)
+    short = make_person(name="Al", address={"street": "x", "city": "y"})
+    n2 = v.to_json_into(short, buf)
+    assert n2 < n
+    assert len(buf) == size
+    assert json.loads(bytes(buf[:n2])) == short
+
+
+def test_to_json_into_offset_and_all_into():
+    v = Person.validator()
+    items = [make_person(age=i) for i in range(3)]
+
+    buf = bytearray()
+    end = 0
+    bounds = [0]
+    for item in items:
+        end = v.to_json_into(item, buf, end)
+        bounds.append(end)
+    assert [json.loads(bytes(buf[a:b])) for a, b in zip(bounds, bounds[1:])] == items
+
+    out = bytearray()
+    offsets = v.to_json_all_into(items, out)
+    assert offsets == bounds
+    assert bytes(out[:offsets[-1]]) == bytes(buf[:end])
+
+
+def test_from_json_str_and_bytes():
+    v = Person.validator()
+    payload = json.dumps(make_person())
+    for data in (payload, payload.encode()):
+        value = v.from_json(data)
+        assert value["name"] == "John Doe"
+        assert value["age"] == 30
+
+
+def test_from_json_errors():
+    v = Person.validator()
+    with pytest.raises(ValueError):
+        v.from_json(b'{"name": ')
+    with pytest.raises(ModelValidationError):
+        v.from_json(b'[1, 2, 3]')
+    with pytest.raises(ModelValidationError):
+        v.from_json(json.dumps(make_person(age=-5)))
+
+
+def test_from_json_multi():
+    v = Person.validator()
+    docs = [json.dumps(make_person(age=i)).encode() for i in range(3)]
+    offsets = [0]
+    for d in docs:
+        offsets.append(offsets[-1] + len(d))
+    values = v.from_json_multi(b"".join(docs), offsets)
+    assert [val["age"] for val in values] == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        v.from_json_multi(b"".join(docs), [0, 10_000])
+
+
+def test_from_json_batch():
+    v = Person.validator()
+    docs = [json.dumps(make_person(age=i)) for i in range(3)]
+    docs[1] = docs[1].encode()  # str and bytes can be mixed
+    assert [val["age"] for val in v.from_json_batch(docs)] == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        v.from_json_batch([docs[0], b'{"name": '])
+    with pytest.raises(ModelValidationError):
+        v.from_json_batch([json.dumps(make_person(age=-1))])
+
+
+def test_to_json_batch():
+    v = Person.validator()
+    items = [make_person(age=i) for i in range(5)]
+    out = v.to_json_batch(items)
+    assert [json.loads(b) for b in out] == items
+
+    with pytest.raises(ModelValidationError):
+        v.to_json_batch([make_person(), make_person(age=-1)])
+
+
+def test_to_json_many():
+    v = Person.validator()
+    items = [make_person(age=i) for i in range(5)]
+    buf, offsets = v.to_json_many(items)
+    assert len(offsets) == len(items) + 1
+    parts = [buf[offsets[i]:offsets[i + 1]] for i in range(len(items))]
+    assert parts == v.to_json_batch(items)
+
+    with pytest.raises(ModelValidationError):
+        v.to_json_many([make_person(), make_person(age=-1)])
+
+
+def test_model_json_from_dict():
+    data = make_person()
+    assert json.loads(Person.json_from_dict(data)) == json.loads(Person(**data).model_dump_json())
+    with pytest.raises(ModelValidationError):
+        Person.json_from_dict(make_person(name="x"))
+
+
+def test_model_json_bytes():
+    person = Person(**make_person())
+    out = person.json_bytes()
+    assert isinstance(out, bytes)
+    assert json.loads(out) == json.loads(person.model_dump_json())
+
+
+def test_try_to_json_and_try_from_json():
+    v = Person.validator()
+    data = make_person()
+    ok = v.try_to_json(data)
+    assert ok.is_valid
+    assert ok.value == v.to_json(data)
+    assert not v.try_to_json(make_person(age=-1)).is_valid
+
+    assert v.try_from_json(json.dumps(data)).value == v.from_json(json.dumps(data))
+    for bad in (b'{"name": ', b'[1, 2, 3]', json.dumps(make_person(age=-1))):
+        result = v.try_from_json(bad)
+        assert not result.is_valid
+        assert result.errors
+
+
+def test_validate_cached():
+    v = Person.validator()
+    good = json.dumps(make_person()).encode()
+    bad = json.dumps(make_person(age=-1))
+    assert v.validate_cached(good) is True
+    assert v.validate_cached(good) is True
+    assert v.validate_cached(bad) is False
+    assert v.validate_cached(b'{"name": ') is False
+    assert good in v._validity_cache
+
+
+def test_validate_cached_eviction():
+    v = Person.validator()
+    v._validity_cache.clear()
+    v.VALIDITY_CACHE_SIZE = 4  # instance override keeps the test small
+    try:
+        payloads = [json.dumps(make_person(age=i)) for i in range(6)]
+        payloads[5] = json.dumps(make_person(age=-1))
+        assert [v.validate_cached(p) for p in payloads] == [True] * 5 + [False]
+        # Oldest entries went first
+        assert list(v._validity_cache) == payloads[2:]
+        # An evicted payload is validated again, not misreported
+        assert v.validate_cached(payloads[0]) is True
+        assert len(v._validity_cache) == 4
+    finally:
+        del v.VALIDITY_CACHE_SIZE
+        v._validity_cache.clear()
+
+
+def test_validate_cached_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    v = Person.validator()
+    v._validity_cache.clear()
+    v.VALIDITY_CACHE_SIZE = 8
+    try:
+        payloads = [json.dumps(make_person(age=i % 40 - 5)) for i in range(400)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(v.validate_cached, payloads))
+        assert results == [i % 40 >= 5 for i in range(400)]
+        assert len(v._validity_cache) <= 8
+    finally:
+        del v.VALIDITY_CACHE_SIZE
+        v._validity_cache.clear()
@@ -0,0 +1,376 @@
+"""Regression guard for the MAP-Elites tuned validator configurations.
+
+benchmarks/map_elites_results.json records, per workload profile, the
+batch_size / micro_batch_size found by the MAP-Elites search. These tests
+rebuild a small workload of each profile's shape and check that the tuned
+settings still run and are not slower than the validator defaults.
+
+Only the untimed smoke test runs by default. The throughput comparisons
+take several seconds of wall-clock benchmarking per profile and depend on
+machine load, so they are opt-in.
+
+Environment:
+    SATYA_TUNING_BENCH: if "1", run the timed throughput tests
+    SATYA_TUNING_FLOOR: minimum accepted tuned/default throughput ratio
+        (default 0.98)
+    SATYA_TUNING_LOG: if set, a file that measurements are appended to
+        (also enables the timed tests)
+"""
+import json
+import os
+import random
+import statistics
+import sys
+import timeit
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from pathlib import Path
+
+import pytest
+
+try:
+    import numpy as np
+except ImportError:  # numpy only speeds up data generation
+    np = None
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+# Add src to Python path for proper imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import satya
+
+RESULTS_PATH = Path(__file__).resolve().parent.parent / "benchmarks" / "map_elites_results.json"
+SAMPLE_SIZE = 2000
+MAX_PROFILES = 3
+DEFAULT_MICRO_BATCH = 512
+FLOOR = float(os.environ.get("SATYA_TUNING_FLOOR", "0.98"))
+
+timed = pytest.mark.skipif(
+    os.environ.get("SATYA_TUNING_BENCH") != "1" and not os.environ.get("SATYA_TUNING_LOG"),
+    reason="timed tuning benchmark; set SATYA_TUNING_BENCH=1 to run",
+)
+
+# _setup_validator results by model shape; see _setup_validator
+_VALIDATOR_CACHE = {}
+# msgspec struct classes by field set; see _msgspec_struct
+_STRUCT_CACHE = {}
+
+
+def _log(line: str) -> None:
+    path = os.environ.get("SATYA_TUNING_LOG")
+    if path:
+        with open(path, "a") as f:
+            f.write(line + "\n")
+
+
+@lru_cache(maxsize=None)
+def _parse_results(path: str):
+    """Parsed results file, read once per session and shared by every test."""
+    data = Path(path).read_bytes()
+    if _HAVE_ORJSON:
+        return orjson.loads(data)["results"]
+    return json.loads(data)["results"]
+
+
+def _load_results():
+    if not RESULTS_PATH.exists():
+        pytest.skip(f"{RESULTS_PATH.name} not found")
+    return _parse_results(str(RESULTS_PATH))
+
+
+def _generate_test_data(profile, num_items, rng=None):
+    """Items with the profile's field count and string length.
+
+    Draws from ``rng`` (a random.Random), by default a fresh
+    random.Random(42), never from the global random state: the same
+    profile always yields the same items (cached items are identical in
+    every test) and other tests are unaffected.
+
+    Field names are interned once and shared by every row. f-string keys
+    are otherwise fresh objects per row, so each lookup by the validator
+    would have to compare characters instead of matching on identity.
+    (Satya has no column-oriented batch input, so rows stay dicts.)
+    """
+    field_count = int(profile["field_count"])
+    avg_len = int(profile["avg_string_length"])
+    if rng is None:
+        rng = random.Random(42)
+    if np is not None:
+        return _generate_test_data_np(field_count, avg_len, num_items, rng.getrandbits(64))
+    extra_keys = [(sys.intern(f"n{i}" if i % 2 else f"s{i}"), bool(i % 2)) for i in range(3, field_count)]
+    name_str = "A" * avg_len
+    short_str = "X" * max(1, avg_len // 2)
+    items = []
+    for _ in range(num_items):
+        item = {"name": name_str, "age": rng.randint(18, 80), "email": "user@example.com"}
+        for key, is_int in extra_keys:
+            if is_int:
+                item[key] = rng.randint(0, 1_000_000)
+            else:
+                item[key] = short_str
+        items.append(item)
+    return items
+
+
+def _generate_test_data_np(field_count, avg_len, num_items, seed):
+    """Same fields, in the same order, as _generate_test_data, drawn with numpy.
+
+    The int values come from numpy's generator, so they differ from the
+    pure-Python path: the exact items depend on whether numpy is installed.
+
+    All extra int fields come from a single (num_items, n) draw, so wide
+    profiles cost one C call rather than one per column.
+    """
+    rng = np.random.default_rng(seed)
+    ages = rng.integers(18, 81, size=num_items).tolist()
+    # n3, s4, n5, ...: ints at even positions, strings at odd ones
+    extra_keys = [sys.intern(f"n{i}" if i % 2 else f"s{i}") for i in range(3, field_count)]
+    num_ints = (len(extra_keys) + 1) // 2
+    int_rows = rng.integers(0, 1_000_001, size=(num_items, num_ints)).tolist()
+    # Strings are immutable: every row can share the same objects
+    name_str = "A" * avg_len
+    short_str = "X" * max(1, avg_len // 2)
+    template = [short_str] * len(extra_keys)
+    items = []
+    for k in range(num_items):
+        values = template.copy()
+        values[0::2] = int_rows[k]
+        item = {"name": name_str, "age": ages[k], "email": "user@example.com"}
+        item.update(zip(extra_keys, values))
+        items.append(item)
+    return items
+
+
+def _setup_validator(profile):
+    """Validator for a model matching _generate_test_data's items.
+
+    Constraints are switched on as the profile's constraint_complexity grows.
+    The two complexity thresholds and the field count are the only inputs
+    that change the model, so profiles sharing them share one validator
+    (model class creation and schema compilation happen once per shape).
+    """
+    complexity = float(profile["constraint_complexity"])
+    field_count = int(profile["field_count"])
+    key = (complexity > 0.5, complexity > 0.7, field_count)
+    if key in _VALIDATOR_CACHE:
+        return _VALIDATOR_CACHE[key]
+    constrained = complexity > 0.5
+    attrs = {
+        "name": satya.Field(str, min_length=1) if constrained else satya.Field(str),
+        "age": satya.Field(int, ge=0, le=150) if constrained else satya.Field(int),
+        "email": satya.Field(str, email=True) if complexity > 0.7 else satya.Field(str),
+    }
+    anns = {"name": str, "age": int, "email": str}
+    for i in range(3, field_count):
+        if i % 2:
+            attrs[f"n{i}"] = satya.Field(int, ge=0) if constrained else satya.Field(int)
+            anns[f"n{i}"] = int
+        else:
+            attrs[f"s{i}"] = satya.Field(str, min_length=1) if constrained else satya.Field(str)
+            anns[f"s{i}"] = str
+    ModelCls = type("DynModel", (satya.Model,), {**attrs, "__annotations__": anns})
+    validator = _VALIDATOR_CACHE[key] = ModelCls.validator()
+    return validator
+
+
+def _split(items, micro_batch_size):
+    """Micro-batches of items, sliced once so the timed loop does no slicing.
+
+    A micro_batch_size covering all items gives a single batch, i.e. one
+    validate_batch call for the whole list.
+    """
+    if micro_batch_size >= len(items):
+        return [items]
+    return [items[i : i + micro_batch_size] for i in range(0, len(items), micro_batch_size)]
+
+
+@contextmanager
+def _batch_size_scope(validator, batch_size):
+    """Run the block with the validator's batch size set, then restore it."""
+    core = validator._validator
+    orig = core.get_batch_size()
+    core.set_batch_size(batch_size)
+    try:
+        yield
+    finally:
+        core.set_batch_size(orig)
+
+
+def _run_once(validate_batch, batches):
+    for batch in batches:
+        validate_batch(batch)
+
+
+def _measure_ips(validator, batches):
+    """Items validated per second at the validator's current batch size.
+
+    timeit's autorange repeats the workload until one measurement takes at
+    least 0.2 s; timeit also keeps the cyclic GC off while timing.
+    """
+    num_items = sum(map(len, batches))
+    timer = timeit.Timer(partial(_run_once, validator._validator.validate_batch, batches))
+    loops, elapsed = timer.autorange()
+    return loops * num_items / elapsed
+
+
+@pytest.fixture(scope="session")
+def profile_bench_cache():
+    return {}
+
+
+def get_bench(cache, profile, n):
+    """(items, validator) for a profile, built once per test session."""
+    key = (json.dumps(profile, sort_keys=True), n)
+    if key not in cache:
+        cache[key] = (_generate_test_data(profile, n), _setup_validator(profile))
+    return cache[key]
+
+
+def _flush_cache(size=32 * 1024 * 1024):
+    """Evict the items from CPU caches by writing a buffer larger than L2/L3.
+
+    Otherwise the second of two back-to-back measurements over the same
+    items starts warm and gets a head start the first did not have.
+    """
+    bytearray(size)
+
+
+def _run_spread(measure_fn, repeats=5):
+    """(min, median, max) ips over several measurements.
+
+    Timing noise only ever adds delay, so the fastest repeat (max ips) is
+    the least disturbed estimate and is what the test compares. The min and
+    median are logged to show how noisy the machine is, which is what
+    SATYA_TUNING_FLOOR should be set from.
+    """
+    runs = sorted(measure_fn() for _ in range(repeats))
+    return runs[0], statistics.median(runs), runs[-1]
+
+
+def _fmt_spread(spread):
+    return "/".join(f"{ips:.0f}" for ips in spread)
+
+
+def test_best_configs_smoke(profile_bench_cache):
+    for entry in _load_results()[:MAX_PROFILES]:
+        items, validator = get_bench(profile_bench_cache, entry["profile"], SAMPLE_SIZE)
+        tuned = entry["satya_config"]
+        batch = items[: int(tuned["micro_batch_size"])]
+        with _batch_size_scope(validator, int(tuned["batch_size"])):
+            try:
+                validator._validator.validate_batch(batch)
+            except Exception as e:
+                pytest.fail(f"validate_batch failed with tuned config {tuned}: {e!r}")
+
+
+@contextmanager
+def _pinned_to_one_cpu():
+    """Run the block on a single core (where the OS supports it), then restore.
+
+    Keeps the measurements from being disturbed by migrating between cores.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    allowed = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {min(allowed)})
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, allowed)
+
+
+def _measure_profile(items, validator, tuned):
+    """Throughput spreads for one results entry.
+
+    Returns (default, tuned, default_chunked, tuned_chunked). default and
+    tuned are the same workload, the whole list in one validate_batch call,
+    at the default and the tuned batch_size, so they differ only in the
+    tuned setting. The chunked pair splits the list in Python at
+    DEFAULT_MICRO_BATCH and the tuned micro_batch_size; it is only logged.
+    """
+    single_batch = _split(items, len(items))
+    default_batches = _split(items, DEFAULT_MICRO_BATCH)
+    tuned_batches = _split(items, int(tuned["micro_batch_size"]))
+
+    default = _run_spread(lambda: _measure_ips(validator, single_batch))
+    _flush_cache()
+    with _batch_size_scope(validator, int(tuned["batch_size"])):
+        tuned_spread = _run_spread(lambda: _measure_ips(validator, single_batch))
+        _flush_cache()
+        tuned_chunked = _run_spread(lambda: _measure_ips(validator, tuned_batches))
+    _flush_cache()
+    default_chunked = _run_spread(lambda: _measure_ips(validator, default_batches))
+    return default, tuned_spread, default_chunked, tuned_chunked
+
+
+@timed
+def test_tuned_not_worse_than_default(profile_bench_cache):
+    compared = 0
+    for entry in _load_results()[:MAX_PROFILES]:
+        profile = entry["profile"]
+        items, validator = get_bench(profile_bench_cache, profile, SAMPLE_SIZE)
+        tuned = entry["satya_config"]
+        # A tuned batch_size equal to the default would compare the same
+        # configuration against itself, so pass/fail would be pure noise
+        default_batch_size = validator._validator.get_batch_size()
+        if int(tuned["batch_size"]) == default_batch_size:
+            _log(f"{profile} no-op: tuned batch_size == default ({default_batch_size})")
+            continue
+        compared += 1
+
+        # Profiles are measured one after another: run side by side they
+        # would compete for shared cache and turbo headroom
+        with _pinned_to_one_cpu():
+            default, tuned_spread, default_chunked, tuned_chunked = _measure_profile(items, validator, tuned)
+        _log(f"{profile} default_min/med/max={_fmt_spread(default)} "
+             f"tuned_min/med/max={_fmt_spread(tuned_spread)} "
+             f"default_chunked_min/med/max={_fmt_spread(default_chunked)} "
+             f"tuned_chunked_min/med/max={_fmt_spread(tuned_chunked)}")
+        default_ips, tuned_ips = default[2], tuned_spread[2]
+        assert tuned_ips >= FLOOR * default_ips, (
+            f"tuned config {tuned} slower than default for {profile}: "
+            f"{tuned_ips:.0f} < {FLOOR} * {default_ips:.0f} items/s"
+        )
+    if not compared:
+        pytest.skip("every tuned batch_size equals the default; nothing to compare")
+
+
+def _msgspec_struct(msgspec, fields):
+    """A msgspec Struct class with the given (name, type) fields, built once."""
+    key = tuple(sorted(fields, key=lambda f: f[0]))
+    if key not in _STRUCT_CACHE:
+        _STRUCT_CACHE[key] = msgspec.defstruct("Person", fields)
+    return _STRUCT_CACHE[key]
+
+
+def _convert_all(convert, struct, items):
+    for it in items:
+        convert(it, struct)
+
+
+@timed
+def test_ratio_vs_msgspec_optional(profile_bench_cache):
+    msgspec = pytest.importorskip("msgspec")
+    for entry in _load_results()[:MAX_PROFILES]:
+        profile = entry["profile"]
+        items, validator = get_bench(profile_bench_cache, profile, SAMPLE_SIZE)
+        tuned = entry["satya_config"]
+        batches = _split(items, int(tuned["micro_batch_size"]))
+        with _batch_size_scope(validator, int(tuned["batch_size"])):
+            satya_ips = _measure_ips(validator, batches)
+
+        Person = _msgspec_struct(msgspec, [(k, type(v)) for k, v in items[0].items()])
+        # Untimed pass: every item must convert, so the timed loop needs no
+        # exception handling (a ValidationError here fails the test)
+        _convert_all(msgspec.convert, Person, items)
+        loops, elapsed = timeit.Timer(partial(_convert_all, msgspec.convert, Person, items)).autorange()
+        msgspec_ips = loops * len(items) / elapsed
+
+        _log(f"{profile} satya_ips={satya_ips:.0f} msgspec_ips={msgspec_ips:.0f} "
+             f"ratio={satya_ips / msgspec_ips:.2f} recorded_ratio={entry['ratio']:.2f}")
+        assert satya_ips > 0 and msgspec_ips > 0
@@ -261,6 +261,23 @@ class TestModelValidation(unittest.TestCase):
 class TestModelAPI(unittest.TestCase):
     """Test Pydantic-like API methods"""
 
+    def test_validator_cached_per_class(self):
+        """validator() is built once per class and never shared with subclasses"""
+        class Base(Model):
+            name: str
+
+        class Child(Base):
+            age: int
+
+        base_validator = Base.validator()
+        self.assertIs(Base.validator(), base_validator)
+        self.assertIsNot(Child.validator(), base_validator)
+        self.assertIs(Child.validator(), Child.validator())
+
+        # Child's extra required field is enforced by its own validator
+        self.assertFalse(Child.validator().validate({"name": "x"}).is_valid)
+        self.assertTrue(Base.validator().validate({"name": "x"}).is_valid)
+
     def test_model_validate(self):
         """Test model_validate class method"""
         data = {
@@ -311,6 +328,9 @@ class TestModelAPI(unittest.TestCase):
         dumped = person.model_dump()
         self.assertIsInstance(dumped, dict)
         self.assertEqual(dumped['name'], "John Doe")
+        self.assertIsInstance(dumped['address'], dict)
+        # Unfiltered fast path matches the filtering path
+        self.assertEqual(dumped, person.model_dump(include=set(Person.__fields__)))
 
     def test_model_dump_json(self):
         """Test model_dump_json method"""